@@ -37,7 +37,7 @@ DOCUMENTATION = r"""
         page_size:
             description: 
                 - Number of results to return per page.
-                - Default is determined by the API.
+                - Defaults to 100, the largest page the API allows; larger values are capped at 100.
             required: false
             type: int
         max_pages:
@@ -52,6 +52,13 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
         name:
             description:
                 - Client-side filter to return only agent pools with an exact matching name (case-sensitive).
@@ -81,6 +88,7 @@ DOCUMENTATION = r"""
         - Authentication requires a valid HCP Terraform API token.
         - Agent pools are organization-specific.
         - Returns raw API response from HCP Terraform.
+        - Connections to the API are pooled per Ansible worker; set TFE_HCP_POOL_MAXSIZE to change the pool size (default 32).
     seealso:
         - module: benemon.hcp_community_collection.hcp_terraform_agent_pool
         - module: benemon.hcp_community_collection.hcp_terraform_workspace
@@ -36,7 +36,7 @@ DOCUMENTATION = r"""
         page_size:
             description: 
                 - Number of results to return per page.
-                - Default is determined by the API.
+                - Defaults to 100, the largest page the API allows; larger values are capped at 100.
             required: false
             type: int
         max_pages:
@@ -51,6 +51,13 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
         last_ping_since:
             description:
                 - Filter agents by their last ping time.
@@ -69,6 +76,7 @@ DOCUMENTATION = r"""
         - Authentication requires a valid HCP Terraform API token.
         - Agent status can be 'idle' (ready to run jobs), 'busy' (currently running a job), 'errored' (unable to run jobs), or 'exited' (no longer connected).
         - Returns raw API response from HCP Terraform.
+        - Connections to the API are pooled per Ansible worker; set TFE_HCP_POOL_MAXSIZE to change the pool size (default 32).
     seealso:
         - module: benemon.hcp_community_collection.hcp_terraform_agent_token
         - module: benemon.hcp_community_collection.hcp_terraform_agent_pool
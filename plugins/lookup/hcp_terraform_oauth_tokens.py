@@ -42,7 +42,7 @@ DOCUMENTATION = r"""
         page_size:
             description: 
                 - Number of results to return per page.
-                - Default is determined by the API.
+                - Defaults to 100, the largest page the API allows; larger values are capped at 100.
             required: false
             type: int
         max_pages:
@@ -57,9 +57,17 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
     notes:
         - Authentication requires a valid HCP Terraform API token.
         - Returns raw API response from HCP Terraform.
+        - Connections to the API are pooled per Ansible worker; set TFE_HCP_POOL_MAXSIZE to change the pool size (default 32).
     seealso:
         - module: benemon.hcp_community_collection.hcp_terraform_oauth_clients
         - module: benemon.hcp_community_collection.hcp_terraform_state_versions
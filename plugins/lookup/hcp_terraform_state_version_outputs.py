@@ -73,6 +73,7 @@ DOCUMENTATION = r"""
         page_size:
             description: 
                 - Number of results to return per page when listing outputs.
+                - Defaults to 100, the largest page the API allows; larger values are capped at 100.
             required: false
             type: int
         max_pages:
@@ -87,6 +88,13 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
         wait_for_processing:
             description:
                 - Whether to wait for HCP Terraform to finish processing the state version.
@@ -105,6 +113,7 @@ DOCUMENTATION = r"""
         - Authentication requires a valid HCP Terraform API token.
         - State version outputs might not be immediately available after a state version is uploaded.
         - Sensitive values will be returned as null unless you have proper permissions.
+        - Connections to the API are pooled per Ansible worker; set TFE_HCP_POOL_MAXSIZE to change the pool size (default 32).
     seealso:
         - name: Terraform API Documentation - State Version Outputs
           link: https://developer.hashicorp.com/terraform/cloud-docs/api-docs/state-version-outputs
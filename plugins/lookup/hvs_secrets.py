@@ -96,9 +96,18 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        hcp_cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - A repeat lookup that only changes order_by is sorted from the cached listing
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
     notes:
         - Authentication requires either an API token (hcp_token/HCP_TOKEN) or client credentials (hcp_client_id + hcp_client_secret)
         - Authentication methods cannot be mixed - use either token or client credentials
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over playbook parameters
         - All timestamps are returned in RFC3339 format
         - All responses are paginated by default with a default page size
@@ -320,11 +329,12 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _ENDPOINT_TMPL = "secrets/{api}/organizations/{org}/projects/{proj}/apps/{app}/secrets"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -334,15 +344,9 @@ class LookupModule(HCPLookup):
             raise AnsibleError(str(e))  # Convert to AnsibleError for better error reporting
     def run(self, terms, variables=None, **kwargs):
         """List secrets in an HVS app."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -356,8 +360,13 @@ class LookupModule(HCPLookup):
             raise
 
         # Build endpoint
-        endpoint = (f"secrets/{self.api_version}/organizations/{variables['organization_id']}"
-                   f"/projects/{variables['project_id']}/apps/{variables['app_name']}/secrets")
+        endpoint = self._format_endpoint(
+            self._ENDPOINT_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            app=variables['app_name']
+        )
 
         try:
             # The base class now handles all parameter processing
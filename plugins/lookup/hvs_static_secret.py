@@ -77,6 +77,7 @@ DOCUMENTATION = r"""
     notes:
         - Authentication requires either an API token (hcp_token/HCP_TOKEN) or client credentials (hcp_client_id + hcp_client_secret)
         - Authentication methods cannot be mixed - use either token or client credentials
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over playbook parameters
         - All timestamps are returned in RFC3339 format
         - Secret must already exist and be of type 'kv'
@@ -223,11 +224,13 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _SECRET_TMPL = ("secrets/{api}/organizations/{org}/projects/{proj}"
+                    "/apps/{app}/secrets/{secret}")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -237,15 +240,9 @@ class LookupModule(HCPLookup):
             raise AnsibleError(str(e))  # Convert to AnsibleError for better error reporting
     def run(self, terms, variables=None, **kwargs):
         """Retrieve a static secret value from HVS."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -260,9 +257,14 @@ class LookupModule(HCPLookup):
             raise
         
         # First get metadata to confirm type
-        metadata_endpoint = (f"secrets/{self.api_version}/organizations/{variables['organization_id']}"
-                           f"/projects/{variables['project_id']}/apps/{variables['app_name']}"
-                           f"/secrets/{variables['secret_name']}")
+        metadata_endpoint = self._format_endpoint(
+            self._SECRET_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            app=variables['app_name'],
+            secret=variables['secret_name']
+        )
 
         try:
             metadata = self._make_request('GET', metadata_endpoint, variables)
@@ -276,20 +278,15 @@ class LookupModule(HCPLookup):
             display.error(f"Error retrieving secret metadata: {str(e)}")
             raise AnsibleError(f'Error retrieving secret metadata: {str(e)}')
 
-        # Build base endpoint
-        base_endpoint = (f"secrets/{self.api_version}/organizations/{variables['organization_id']}"
-                        f"/projects/{variables['project_id']}/apps/{variables['app_name']}"
-                        f"/secrets/{variables['secret_name']}")
-
         # Check if specific version is requested
         if 'version' in variables:
             try:
                 version = int(variables['version'])
-                endpoint = f"{base_endpoint}/versions/{version}:open"
+                endpoint = f"{metadata_endpoint}/versions/{version}:open"
             except ValueError:
                 raise AnsibleError(f"Invalid version number: {variables['version']}")
         else:
-            endpoint = f"{base_endpoint}:open"
+            endpoint = f"{metadata_endpoint}:open"
 
         try:
             # Make request to get secret
@@ -91,9 +91,18 @@ DOCUMENTATION = r"""
             required: false
             type: list
             elements: str
+        hcp_cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - A repeat lookup that only changes order_by is sorted from the cached listing
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
     notes:
         - Authentication requires either an API token or client credentials
         - Authentication methods cannot be mixed
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over parameters
         - All timestamps are returned in RFC3339 format
         - Sorting fields must be immutable, unique and orderable
@@ -229,11 +238,12 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _ENDPOINT_TMPL = "packer/{api}/organizations/{org}/projects/{proj}/buckets"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -244,15 +254,9 @@ class LookupModule(HCPLookup):
 
     def run(self, terms, variables=None, **kwargs):
         """List buckets from HCP Packer registry."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -265,8 +269,12 @@ class LookupModule(HCPLookup):
             raise
 
         # Build endpoint
-        endpoint = (f"packer/{self.api_version}/organizations/{variables['organization_id']}"
-                  f"/projects/{variables['project_id']}/buckets")
+        endpoint = self._format_endpoint(
+            self._ENDPOINT_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id']
+        )
 
         # Process optional parameters
         params = {}
@@ -71,6 +71,7 @@ DOCUMENTATION = r"""
     notes:
         - Authentication requires either an API token (hcp_token/HCP_TOKEN) or client credentials (hcp_client_id + hcp_client_secret)
         - Authentication methods cannot be mixed - use either token or client credentials
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over playbook parameters
         - All timestamps are returned in RFC3339 format
         - Channel must exist in the specified bucket
@@ -193,11 +194,13 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _ENDPOINT_TMPL = ("packer/{api}/organizations/{org}/projects/{proj}"
+                      "/buckets/{bucket}/channels/{channel}")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -207,15 +210,9 @@ class LookupModule(HCPLookup):
             raise AnsibleError(str(e))  # Convert to AnsibleError for better error reporting
     def run(self, terms, variables=None, **kwargs):
         """Get channel information from HCP Packer registry."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -230,9 +227,14 @@ class LookupModule(HCPLookup):
             raise
 
         # Build endpoint
-        endpoint = (f"packer/2023-01-01/organizations/{variables['organization_id']}"
-                   f"/projects/{variables['project_id']}/buckets/{variables['bucket_name']}"
-                   f"/channels/{variables['channel_name']}")
+        endpoint = self._format_endpoint(
+            self._ENDPOINT_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            bucket=variables['bucket_name'],
+            channel=variables['channel_name']
+        )
 
         try:
             display.vvv(f"Making request to endpoint: {endpoint}")
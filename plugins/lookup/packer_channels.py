@@ -40,6 +40,14 @@ DOCUMENTATION = r"""
             type: str
             env:
                 - name: HCP_TOKEN
+        hcp_cache:
+            description:
+                - Cache responses on disk and revalidate them with their ETag on later runs
+                - An unchanged resource is answered with HTTP 304 and served from the cache
+                - Cache files are written to C(~/.cache/ansible-hcp), or to HCP_CACHE_DIR when set
+            required: false
+            type: bool
+            default: false
         hcp_client_id:
             description:
                 - HCP Client ID for OAuth authentication
@@ -58,6 +66,14 @@ DOCUMENTATION = r"""
             type: str
             env:
                 - name: HCP_CLIENT_SECRET
+        include_versions:
+            description:
+                - Also retrieve the full version assigned to each channel
+                - Versions are fetched in parallel and attached to each channel as C(version_detail)
+                - Each distinct version is only requested once
+            required: false
+            type: bool
+            default: false
         location_region_provider:
             description:
                 - Cloud provider for the region
@@ -74,12 +90,14 @@ DOCUMENTATION = r"""
     notes:
         - Authentication requires either an API token or client credentials
         - Authentication methods cannot be mixed
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over parameters
         - All timestamps are returned in RFC3339 format
         - Bucket must exist in the project
         - Returns error if bucket does not exist
         - Returns empty list if bucket has no channels
         - Managed channels (like 'latest') have special behavior
+        - Setting include_versions avoids a separate packer_version lookup per channel
     seealso:
         - module: benemon.hcp_community_collection.packer_buckets
         - module: benemon.hcp_community_collection.packer_versions
@@ -114,6 +132,17 @@ EXAMPLES = r"""
     - name: Handle lookup failure
       debug:
         msg: "Failed to get channels from bucket"
+
+# Retrieve channels together with their assigned versions' builds
+- name: Get AMI IDs for every channel
+  ansible.builtin.debug:
+    msg: "{{ item.name }}: {{ item.version_detail.builds | map(attribute='artifacts') | flatten | map(attribute='external_identifier') | list }}"
+  loop: "{{ lookup('benemon.hcp_community_collection.packer_channels',
+            'organization_id=my-org-id',
+            'project_id=my-project-id',
+            'bucket_name=my-images',
+            'include_versions=true') }}"
+  when: item.version_detail is defined
 """
 
 RETURN = r"""
@@ -165,6 +194,12 @@ RETURN = r"""
             description: Version build fingerprint
             type: str
             returned: always
+      version_detail:
+        description:
+          - Full version assigned to the channel, as returned by the packer_version lookup
+          - Includes builds and artifacts
+        type: dict
+        returned: when include_versions is true and a version is assigned
       managed:
         description: Whether this is a managed channel (like 'latest')
         type: bool
@@ -177,13 +212,16 @@ RETURN = r"""
 
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_lookup import HCPLookup
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import str_to_bool
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
+from urllib.parse import quote
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _BUCKET_TMPL = "packer/{api}/organizations/{org}/projects/{proj}/buckets/{bucket}"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -194,15 +232,9 @@ class LookupModule(HCPLookup):
 
     def run(self, terms, variables=None, **kwargs):
         """List channels from HCP Packer registry bucket."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -216,18 +248,53 @@ class LookupModule(HCPLookup):
             raise
 
         # Build endpoint
-        endpoint = (f"packer/{self.api_version}/organizations/{variables['organization_id']}"
-                  f"/projects/{variables['project_id']}/buckets/{variables['bucket_name']}/channels")
+        bucket_endpoint = self._format_endpoint(
+            self._BUCKET_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            bucket=variables['bucket_name']
+        )
+        endpoint = f"{bucket_endpoint}/channels"
 
         try:
             display.vvv(f"Making request to endpoint: {endpoint}")
             # Pass the query_params to _handle_pagination
-            result = self._make_request("GET", endpoint, variables)
+            result = self._make_request("GET", endpoint, variables, cacheable=True)
             
             channels = result.get('channels', [])
             display.vvv(f"Retrieved {len(channels)} channels")
+
+            if str_to_bool(variables.get('include_versions', False)):
+                self._attach_version_details(channels, bucket_endpoint, variables)
+
             return [channels]
             
         except Exception as e:
             display.error(f"Error listing channels: {str(e)}")
-            raise AnsibleError(f'Error listing channels: {str(e)}')
\ No newline at end of file
+            raise AnsibleError(f'Error listing channels: {str(e)}')
+
+    def _attach_version_details(self, channels, bucket_endpoint, variables):
+        """Fetch the version assigned to each channel in parallel and attach it as version_detail."""
+        fingerprints = list(dict.fromkeys(
+            channel['version']['fingerprint']
+            for channel in channels
+            # Channels without an assigned version carry "version": null
+            if (channel.get('version') or {}).get('fingerprint')
+        ))
+
+        display.vvv(f"Fetching {len(fingerprints)} assigned versions")
+        responses = self._make_concurrent_requests(
+            [f"{bucket_endpoint}/versions/{quote(fingerprint, safe='')}" for fingerprint in fingerprints],
+            variables,
+            cacheable=True
+        )
+        versions = {
+            fingerprint: response.get('version', {})
+            for fingerprint, response in zip(fingerprints, responses)
+        }
+
+        for channel in channels:
+            fingerprint = (channel.get('version') or {}).get('fingerprint')
+            if fingerprint in versions:
+                channel['version_detail'] = versions[fingerprint]
@@ -39,6 +39,15 @@ DOCUMENTATION = r"""
                 - Must be a valid fingerprint in the specified bucket
             required: true
             type: str
+        fields:
+            description:
+                - Only return the listed fields of each version
+                - Accepts a list or a comma separated string of field names
+                - Use dotted paths to select fields of nested objects and lists, for example C(builds.artifacts.region)
+                - Returns the full version if not specified
+            required: false
+            type: list
+            elements: str
         hcp_token:
             description:
                 - HCP API token for authentication
@@ -48,6 +57,14 @@ DOCUMENTATION = r"""
             type: str
             env:
                 - name: HCP_TOKEN
+        hcp_cache:
+            description:
+                - Cache responses on disk and revalidate them with their ETag on later runs
+                - An unchanged resource is answered with HTTP 304 and served from the cache
+                - Cache files are written to C(~/.cache/ansible-hcp), or to HCP_CACHE_DIR when set
+            required: false
+            type: bool
+            default: false
         hcp_client_id:
             description:
                 - HCP Client ID for OAuth authentication
@@ -71,6 +88,7 @@ DOCUMENTATION = r"""
     notes:
         - Authentication requires either an API token (hcp_token/HCP_TOKEN) or client credentials (hcp_client_id + hcp_client_secret)
         - Authentication methods cannot be mixed - use either token or client credentials
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over playbook parameters
         - All timestamps are returned in RFC3339 format
         - Version must exist in the specified bucket
@@ -79,6 +97,7 @@ DOCUMENTATION = r"""
         - Revocation status and scheduling is included when applicable
         - Template type (HCL2 or JSON) is included in response
         - Metadata includes packer, cicd, and vcs information when available
+        - When fields is set, only the selected fields are returned
     seealso:
         - module: benemon.hcp_community_collection.packer_channel
         - name: HCP Packer Documentation
@@ -128,6 +147,16 @@ EXAMPLES = r"""
   when: item.metadata is defined
   loop_control:
     label: "Build {{ item.id }}"
+
+# Only fetch the fields needed to find AMI IDs
+- name: Get artifact identifiers only
+  ansible.builtin.debug:
+    msg: "{{ lookup('benemon.hcp_community_collection.packer_version',
+             'organization_id=my-org-id',
+             'project_id=my-project-id',
+             'bucket_name=my-images',
+             'fingerprint=abcd1234',
+             'fields=fingerprint,status,builds.platform,builds.artifacts.region,builds.artifacts.external_identifier') }}"
 """
 
 RETURN = r"""
@@ -290,11 +319,13 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _ENDPOINT_TMPL = ("packer/{api}/organizations/{org}/projects/{proj}"
+                      "/buckets/{bucket}/versions/{fp}")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -304,15 +335,9 @@ class LookupModule(HCPLookup):
             raise AnsibleError(str(e))  # Convert to AnsibleError for better error reporting
     def run(self, terms, variables=None, **kwargs):
         """Get version information from HCP Packer registry."""
-        variables = variables or {}
-
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
+        variables = self._parse_terms(terms, variables)
 
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -327,17 +352,23 @@ class LookupModule(HCPLookup):
             raise
 
         # Build endpoint
-        endpoint = (f"packer/{self.api_version}/organizations/{variables['organization_id']}"
-                   f"/projects/{variables['project_id']}/buckets/{variables['bucket_name']}"
-                   f"/versions/{variables['fingerprint']}")
-
+        endpoint = self._format_endpoint(
+            self._ENDPOINT_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            bucket=variables['bucket_name'],
+            fp=variables['fingerprint']
+        )
 
         try:
             display.vvv(f"Making request to endpoint: {endpoint}")
-            result = self._make_request('GET', endpoint, variables)
+            result = self._make_request('GET', endpoint, variables, cacheable=True)
             
             # Extract version information from response
             version = result.get('version', {})
+            if variables.get('fields'):
+                version = self._project_fields(version, self._parse_fields(variables['fields']))
             display.vvv(f"Retrieved version information for fingerprint: {variables['fingerprint']}")
             
             # Return as a list containing a single item (required for lookup plugin)
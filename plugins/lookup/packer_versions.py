@@ -29,8 +29,10 @@ DOCUMENTATION = r"""
                 - Name of the Packer registry bucket
                 - Must exist in the project
                 - Case-sensitive
+                - Several buckets may be given as a list or a comma separated string
+                - Multiple buckets are listed in parallel and their versions returned in bucket order, unless order_by is given, which then sorts the combined list
             required: true
-            type: str
+            type: raw
         hcp_token:
             description:
                 - HCP API token for authentication
@@ -77,6 +79,15 @@ DOCUMENTATION = r"""
             required: false
             type: bool
             default: false
+        fields:
+            description:
+                - Only return the listed fields of each version
+                - Accepts a list or a comma separated string of field names
+                - Use dotted paths to select fields of nested objects and lists, for example C(builds.artifacts.region)
+                - Returns the full version if not specified
+            required: false
+            type: list
+            elements: str
         order_by:
             description:
                 - List of fields to sort results by
@@ -85,9 +96,18 @@ DOCUMENTATION = r"""
             required: false
             type: list
             elements: str
+        hcp_cache_ttl:
+            description:
+                - Seconds to keep a complete listing in memory for repeat lookups in the same worker
+                - A repeat lookup that only changes order_by is sorted from the cached listing
+                - Caching is off by default, so every lookup queries the API; only enable it where a slightly stale listing is acceptable
+            required: false
+            type: float
+            default: 0
     notes:
         - Authentication requires either an API token or client credentials
         - Authentication methods cannot be mixed
+        - Forked workers share one client-credentials token, kept encrypted with a key derived from the client secret in a 0600 file in the run's local temp directory. Set HCP_SHARE_TOKEN=false to have each worker request its own token
         - Environment variables take precedence over parameters
         - All timestamps are returned in RFC3339 format
         - Bucket must exist in the project
@@ -95,6 +115,7 @@ DOCUMENTATION = r"""
         - Returns empty list if bucket has no versions
         - Sorting fields must be immutable, unique and orderable
         - Multiple sort fields can be used for tie-breaking
+        - When fields is set, only the selected fields are returned
     seealso:
         - module: benemon.hcp_community_collection.packer_buckets
         - module: benemon.hcp_community_collection.packer_channels
@@ -130,6 +151,14 @@ EXAMPLES = r"""
              'bucket_name=my-images',
              'order_by=name desc') }}"
 
+# List versions from several buckets in one call
+- name: Get versions across buckets
+  ansible.builtin.debug:
+    msg: "{{ lookup('benemon.hcp_community_collection.packer_versions',
+             'organization_id=my-org-id',
+             'project_id=my-project-id',
+             'bucket_name=web-images,db-images') }}"
+
 # Process versions with error handling
 - name: Get versions safely
   block:
@@ -234,11 +263,12 @@ from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.h
 from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.api_versions import get_api_version
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
-import json
 
 display = Display()
 
 class LookupModule(HCPLookup):
+    _ENDPOINT_TMPL = "packer/{api}/organizations/{org}/projects/{proj}/buckets/{bucket}/versions"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         try:
@@ -249,15 +279,9 @@ class LookupModule(HCPLookup):
 
     def run(self, terms, variables=None, **kwargs):
         """List versions from HCP Packer registry bucket."""
-        variables = variables or {}
+        variables = self._parse_terms(terms, variables)
 
-        # Parse terms into key-value pairs
-        for term in terms:
-            if isinstance(term, str) and '=' in term:
-                key, value = term.split('=', 1)
-                variables[key] = value
-
-        display.vvv(f"Lookup parameters: {json.dumps(variables, indent=2, default=str)}")
+        self._vvv_json("Lookup parameters", variables, redact=True)
 
         # Validate required parameters
         try:
@@ -270,9 +294,10 @@ class LookupModule(HCPLookup):
             display.error(f"Parameter validation failed: {str(e)}")
             raise
 
-        # Build endpoint
-        endpoint = (f"packer/{self.api_version}/organizations/{variables['organization_id']}"
-                  f"/projects/{variables['project_id']}/buckets/{variables['bucket_name']}/versions")
+        # Several buckets may be given as a list or a comma separated string
+        bucket_names = variables['bucket_name']
+        if isinstance(bucket_names, str):
+            bucket_names = [name.strip() for name in bucket_names.split(',') if name.strip()]
 
         try:
             # Process optional filter and sort parameters
@@ -282,14 +307,39 @@ class LookupModule(HCPLookup):
             if 'order_by' in variables:
                 params['sorting.order_by'] = variables['order_by']
 
-            display.vvv(f"Making request to endpoint: {endpoint}")
-            result = self._handle_pagination(endpoint, variables, params)
-            
-            # Extract versions and wrap in list to match other lookup patterns
-            versions = result.get('results', [])
+            # Buckets are listed in parallel and their versions combined in bucket order
+            pages = self._map_concurrently(
+                lambda bucket_name: self._list_bucket_versions(bucket_name, variables, params),
+                list(bucket_names),
+                variables
+            )
+            versions = [version for page in pages for version in page]
+
+            # Each bucket is sorted by the API; the merged list is re-sorted so
+            # order_by applies across buckets, before fields may drop sort keys
+            if 'order_by' in variables and len(pages) > 1:
+                versions = self._sort_results(versions, variables['order_by'])
+
+            if variables.get('fields'):
+                versions = self._project_fields(versions, self._parse_fields(variables['fields']))
             display.vvv(f"Retrieved {len(versions)} versions")
             return [versions]
             
         except Exception as e:
             display.error(f"Error listing versions: {str(e)}")
-            raise AnsibleError(f'Error listing versions: {str(e)}')
\ No newline at end of file
+            raise AnsibleError(f'Error listing versions: {str(e)}')
+
+    def _list_bucket_versions(self, bucket_name, variables, params):
+        """List every version in one bucket, following pagination."""
+        endpoint = self._format_endpoint(
+            self._ENDPOINT_TMPL,
+            api=self.api_version,
+            org=variables['organization_id'],
+            proj=variables['project_id'],
+            bucket=bucket_name
+        )
+
+        display.vvv(f"Making request to endpoint: {endpoint}")
+        # Each bucket paginates with its own copy of the query parameters
+        result = self._handle_pagination(endpoint, variables, dict(params))
+        return result.get('results', [])
\ No newline at end of file
@@ -1,11 +1,17 @@
-API_VERSIONS = {
+from functools import lru_cache
+from types import MappingProxyType
+
+# Read-only, since get_api_version caches its answers
+API_VERSIONS = MappingProxyType({
     "hvs": "2023-11-28",
     "packer": "2023-01-01",
-}
+})
 
+@lru_cache(maxsize=None)
 def get_api_version(service_name):
     """Return the API version for the given service, or raise an error if unknown."""
-    if service_name not in API_VERSIONS:
+    version = API_VERSIONS.get(service_name)
+    if version is None:
         raise ValueError(f"Unknown service '{service_name}', no API version available. "
                          f"Known services: {', '.join(API_VERSIONS.keys())}")
-    return API_VERSIONS[service_name]
+    return version
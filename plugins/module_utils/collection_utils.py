@@ -1,3 +1,19 @@
+import atexit
+import functools
+import json
+import os
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
 def str_to_bool(value):
     """Convert a string representation of truth to true (1) or false (0).
 
@@ -11,4 +27,151 @@ def str_to_bool(value):
     elif value in ('n', 'no', 'f', 'false', 'off', '0'):
         return False
     else:
-        raise ValueError(f"Invalid truth value: {value}")
\ No newline at end of file
+        raise ValueError(f"Invalid truth value: {value}")
+
+
+@functools.lru_cache(maxsize=256)
+def build_url(base, endpoint):
+    """Join an API base URL and endpoint with exactly one slash between them.
+
+    Callers pass endpoints both with and without a leading slash; results are
+    cached because the same few endpoints are requested once per page.
+    """
+    return f"{base.rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+def decode_json(response, default=None):
+    """Decode a requests response body as JSON, or return default when it is empty.
+
+    The raw bytes are parsed with orjson when it is installed, which also skips
+    requests' charset detection for response.text.
+    """
+    content = response.content
+    if not isinstance(content, bytes):
+        # No raw body to parse directly, so defer entirely to requests
+        return response.json() if response.text else default
+    if not content:
+        return default
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let requests raise its own decode error, which callers already handle
+            pass
+    return response.json()
+
+
+def encode_json(data):
+    """Serialize data to compact UTF-8 JSON bytes for a request body.
+
+    orjson is used when it is installed; the stdlib fallback produces the same
+    compact output.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def format_json(obj):
+    """Pretty-print obj as indented JSON for debug output, stringifying anything unserializable."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def parse_retry_after(value, max_delay):
+    """Return the wait in seconds requested by a Retry-After header, or None.
+
+    Both forms allowed by RFC 7231 are accepted: delay-seconds and an HTTP-date.
+    The result is clamped to [0, max_delay]; None means the header was absent
+    or unusable and the caller should fall back to its own backoff.
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        if not isinstance(value, str):
+            return None
+        try:
+            target = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if target.tzinfo is None:
+            target = target.replace(tzinfo=timezone.utc)
+        delay = (target - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), max_delay)
+
+
+def full_jitter_backoff(attempt, base_delay, max_delay):
+    """Return a retry delay drawn uniformly from [0, min(max_delay, base_delay * 2**attempt)].
+
+    Spreading the whole window, rather than adding a little noise to a fixed
+    delay, keeps clients that were throttled together from retrying together.
+    """
+    return random.uniform(0, min(max_delay, base_delay * (1 << attempt)))
+
+
+def _build_session(pool_connections, pool_maxsize, max_retries=0, timeout=None):
+    """Create a requests session with one pooled adapter mounted for https://."""
+    # requests is imported on first use so that loading a plugin does not pay
+    # its import cost in every forked worker
+    import requests
+
+    class _TimeoutHTTPAdapter(requests.adapters.HTTPAdapter):
+        # requests has no session-wide timeout and waits forever by default,
+        # so a stalled endpoint would hang the worker
+        def send(self, request, **kwargs):
+            if kwargs.get('timeout') is None:
+                kwargs['timeout'] = timeout
+            return super().send(request, **kwargs)
+
+    session = requests.Session()
+    session.mount('https://', _TimeoutHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries
+    ))
+    return session
+
+
+class SharedSession:
+    """A requests session shared by every caller in one process.
+
+    settings is called whenever the session is built and returns the keyword
+    arguments for its adapter: pool_connections, pool_maxsize, max_retries and
+    timeout, the (connect, read) default for requests that set none. Reading
+    them at build time lets environment overrides apply in each worker.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def get(self):
+        """Return the session, creating it on first use in this process."""
+        session = self._session
+        if session is not None and self._pid == os.getpid():
+            return session
+
+        with self._lock:
+            # A session inherited across fork() shares its sockets with the parent,
+            # so each worker process builds its own
+            if self._session is None or self._pid != os.getpid():
+                self._session = _build_session(**self._settings())
+                self._pid = os.getpid()
+            return self._session
+
+    def reset(self):
+        """Forget the session so the next get() builds a new one."""
+        with self._lock:
+            self._session = None
+            self._pid = None
+
+    def close(self):
+        """Close the pooled connections, if this process owns the session."""
+        if self._session is not None and self._pid == os.getpid():
+            self._session.close()
@@ -1,25 +1,167 @@
 from ansible.plugins.lookup import LookupBase
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
+import base64
+import copy
+import functools
+import hashlib
+import hmac
 import os
-import requests
 import sys
 import json
+import threading
 import time
 import random 
-from datetime import datetime, timezone, timedelta
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import SharedSession, build_url, decode_json, format_json, parse_retry_after, str_to_bool
+# cryptography is a dependency of ansible-core itself, so it is always present
+from cryptography.fernet import Fernet, InvalidToken
 
 display = Display()
 
-# Module level token cache
+# Module level token cache. The client secret is only kept as a SHA-256
+# digest so the raw credential never lingers in process memory or dumps.
+# A refresh replaces the whole dict so lock-free readers see one entry
 _TOKEN_CACHE = {
     'token': None,
-    'issued_at': None,
-    'expires_in': None,
+    'refresh_after': None,
     'client_id': None,
-    'client_secret': None
+    'client_secret_hash': None
 }
 
+# Response keys that hold the payload of an HCP API response, in order of
+# precedence for the rare response that carries more than one of them
+_RESULT_KEY_ORDER = (
+    'apps', 'secrets', 'secret', 'integrations', 'version', 'versions',
+    'channel', 'channels', 'bucket', 'buckets', 'results'
+)
+_RESULT_KEYS = frozenset(_RESULT_KEY_ORDER)
+
+# Opt-in short-lived cache of complete paginated listings, keyed by endpoint,
+# credentials and filters. Entries are (expires_at, order_by, results). It is
+# off by default so a lookup after a change never returns the stale listing
+_RESULT_CACHE = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_TTL = 0
+
+# Serializes token refreshes so concurrent callers share one OAuth request
+_TOKEN_LOCK = threading.Lock()
+
+# Adaptive pacing of OAuth token requests shared by every lookup in this
+# process: the minimum interval doubles on each 429 and decays by 10% on
+# each success, so callers sharing one quota back off together
+_RATE_STATE = {'min_interval': 0.0, 'last_attempt': 0.0}
+_RATE_LOCK = threading.Lock()
+_RATE_MAX_INTERVAL = 64.0
+
+# Lookup variables whose values must never appear in debug output
+_SENSITIVE_VARIABLES = ('hcp_token', 'hcp_client_secret')
+
+# Default location of the opt-in response cache, overridable with HCP_CACHE_DIR
+_DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'ansible-hcp')
+
+# Upper bound on parallel requests issued by _make_concurrent_requests; the
+# session's connection pool is sized to match so no worker waits on a socket
+_MAX_WORKERS = 8
+# (connect, read) seconds applied to every request made on the shared session
+_TIMEOUT = (10, 60)
+
+def _session_settings():
+    """Adapter settings for the shared session, read when it is built."""
+    # urllib3 is imported on first use, like requests itself
+    from urllib3.util.retry import Retry
+
+    return dict(
+        pool_connections=4,
+        pool_maxsize=_MAX_WORKERS,
+        # Transient edge failures on idempotent reads are retried at the
+        # transport level; the OAuth POST keeps its own backoff loop
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(('GET', 'HEAD')),
+            raise_on_status=False
+        ),
+        timeout=_TIMEOUT
+    )
+
+# Module level HTTP session, shared by every HCP lookup in this process so
+# consecutive lookups reuse pooled keep-alive connections to the HCP API
+_SHARED_SESSION = SharedSession(_session_settings)
+
+def _get_session():
+    """Return the shared requests session for this process."""
+    return _SHARED_SESSION.get()
+
+@functools.lru_cache(maxsize=8)
+def _share_token_enabled(value):
+    """
+    Parse HCP_SHARE_TOKEN, which defaults to on. Memoized per value, so an
+    invalid one warns once and disables sharing rather than failing every request.
+    """
+    if value is None:
+        return True
+    try:
+        return str_to_bool(value)
+    except ValueError:
+        display.warning(f"Invalid HCP_SHARE_TOKEN value '{value}', the token will not be shared between workers")
+        return False
+
+def _pace_token_request():
+    """Wait until the adaptive minimum interval since the last token request has passed."""
+    with _RATE_LOCK:
+        now = time.monotonic()
+        wait = max(0.0, _RATE_STATE['last_attempt'] + _RATE_STATE['min_interval'] - now)
+        # Reserve the slot before sleeping so concurrent callers queue behind it
+        _RATE_STATE['last_attempt'] = now + wait
+    if wait:
+        time.sleep(wait)
+
+def _record_token_response(rate_limited):
+    """Adjust the token request interval: multiplicative increase on 429, decay on success."""
+    with _RATE_LOCK:
+        interval = _RATE_STATE['min_interval']
+        if rate_limited:
+            interval = min(max(interval * 2, 0.1), _RATE_MAX_INTERVAL)
+        else:
+            interval *= 0.9
+            if interval < 0.01:
+                interval = 0.0
+        _RATE_STATE['min_interval'] = interval
+
+def _positive_int(name, value):
+    """Parse a positive integer lookup parameter."""
+    try:
+        number = int(value)
+        if number <= 0:
+            raise ValueError(f"{name} must be positive")
+    except ValueError as e:
+        raise AnsibleError(f"Invalid {name}: {str(e)}")
+    return number
+
+def _string_list(name, value):
+    """Parse a list parameter given either as a list or a comma separated string."""
+    if isinstance(value, str):
+        return value.split(',')
+    if isinstance(value, (list, tuple)):
+        return value
+    raise AnsibleError(f"Invalid {name} parameter format: {value}")
+
+def _passthrough(name, value):
+    return value
+
+# Query and pagination parameters understood by every paginated lookup:
+# (variable name, parser, query parameter, pagination_config key)
+_PARAM_SPEC = (
+    ('page_size', _positive_int, 'pagination.page_size', 'page_size'),
+    ('max_pages', _positive_int, None, 'max_pages'),
+    ('name_contains', _passthrough, 'name_contains', None),
+    ('types', _string_list, 'types', None),
+)
+
 class HCPLookup(LookupBase):
     """Base class for HCP lookup plugins."""
     
@@ -27,6 +169,10 @@ class HCPLookup(LookupBase):
         """Initialize the base class with common configuration."""
         super().__init__(*args, **kwargs)
         self.base_url = "https://api.cloud.hashicorp.com"
+        self._resolved_credentials = None
+        self._param_cache = {}
+        self._cached_token = None
+        self._cached_headers = None
 
         # Warn macOS users about potential fork() safety issues
         if sys.platform == 'darwin' and 'OBJC_DISABLE_INITIALIZE_FORK_SAFETY' not in os.environ:
@@ -35,24 +181,82 @@ class HCPLookup(LookupBase):
                 'if you encounter fork()-related crashes'
             )
 
-    def _should_refresh_token(self):
+    def _parse_terms(self, terms, variables):
+        """Merge key=value terms over variables, returning a new dict and leaving the caller's untouched."""
+        return {
+            **(variables or {}),
+            **dict(term.split('=', 1) for term in terms if isinstance(term, str) and '=' in term)
+        }
+
+    def _redact(self, variables):
+        """Return a copy of variables with credentials masked for logging."""
+        return {
+            key: '********' if key in _SENSITIVE_VARIABLES and value else value
+            for key, value in variables.items()
+        }
+
+    def _dumps(self, obj):
+        """Pretty-print obj as JSON for debug output."""
+        return format_json(obj)
+
+    def _decode_json(self, response):
+        """Decode a JSON response body, treating an empty body as an empty object."""
+        return decode_json(response, {})
+
+    def _vvv_json(self, label, obj, redact=False):
+        """Log obj as JSON at -vvv, skipping redaction and serialization entirely at lower verbosity."""
+        if display.verbosity >= 3:
+            display.vvv(f"{label}: {self._dumps(self._redact(obj) if redact else obj)}")
+
+    def _should_refresh_token(self, cache=None):
         """
         Check if token should be refreshed based on Hashicorp's 2/3 lifetime practice
         """
-        global _TOKEN_CACHE
-        
-        if not all([_TOKEN_CACHE['token'], _TOKEN_CACHE['issued_at'], _TOKEN_CACHE['expires_in']]):
-            return True
+        cache = _TOKEN_CACHE if cache is None else cache
+        refresh_after = cache['refresh_after']
+        return not cache['token'] or refresh_after is None or time.monotonic() >= refresh_after
 
-        now = datetime.now(timezone.utc)
-        issued_at = _TOKEN_CACHE['issued_at']
-        expires_in = timedelta(seconds=_TOKEN_CACHE['expires_in'])
-        
-        # Calculate how far through the token lifetime we are
-        token_age = now - issued_at
-        two_thirds_lifetime = (expires_in * 2) / 3
+    def _token_is_current(self, cache, client_id, client_secret_hash):
+        """Check whether a token cache entry belongs to these credentials and is still fresh."""
+        return (cache['client_id'] == client_id and
+                cache['client_secret_hash'] == client_secret_hash and
+                not self._should_refresh_token(cache))
 
-        return token_age >= two_thirds_lifetime
+    def _resolve_credentials(self, variables):
+        """
+        Resolve the token or client credentials for a variables mapping.
+
+        The result is remembered for the mapping last seen, so the lookups in a
+        paginated run do not repeat the variable and environment lookups or
+        rehash the client secret on every page.
+        """
+        cached = self._resolved_credentials
+        if cached is not None and cached[0] is variables:
+            return cached[1]
+
+        # Check for direct token
+        token = (variables.get('hcp_token') or 
+                os.environ.get('HCP_TOKEN'))
+        if token:
+            credentials = (token, None, None, None)
+        else:
+            # Get client credentials
+            client_id = (variables.get('hcp_client_id') or 
+                        os.environ.get('HCP_CLIENT_ID'))
+            client_secret = (variables.get('hcp_client_secret') or 
+                            os.environ.get('HCP_CLIENT_SECRET'))
+
+            if not (client_id and client_secret):
+                raise AnsibleError(
+                    'No valid authentication found. Please set either HCP_TOKEN/hcp_token '
+                    'or HCP_CLIENT_ID/hcp_client_id and HCP_CLIENT_SECRET/hcp_client_secret'
+                )
+
+            client_secret_hash = hashlib.sha256(client_secret.encode('utf-8')).hexdigest()
+            credentials = (None, client_id, client_secret, client_secret_hash)
+
+        self._resolved_credentials = (variables, credentials)
+        return credentials
 
     def _get_auth_token(self, variables):
         """
@@ -64,59 +268,118 @@ class HCPLookup(LookupBase):
            - Environment: HCP_CLIENT_ID + HCP_CLIENT_SECRET
            - Variables: hcp_client_id + hcp_client_secret
         """
-        # Check for direct token
-        token = (variables.get('hcp_token') or 
-                os.environ.get('HCP_TOKEN'))
+        token, client_id, client_secret, client_secret_hash = self._resolve_credentials(variables)
         if token:
             return token
 
-        # Get client credentials
-        client_id = (variables.get('hcp_client_id') or 
-                    os.environ.get('HCP_CLIENT_ID'))
-        client_secret = (variables.get('hcp_client_secret') or 
-                        os.environ.get('HCP_CLIENT_SECRET'))
-
-        if not (client_id and client_secret):
-            raise AnsibleError(
-                'No valid authentication found. Please set either HCP_TOKEN/hcp_token '
-                'or HCP_CLIENT_ID/hcp_client_id and HCP_CLIENT_SECRET/hcp_client_secret'
-            )
-
         global _TOKEN_CACHE
-        
-        # Check if we should use cached token
-        if (_TOKEN_CACHE['token'] and 
-            _TOKEN_CACHE['client_id'] == client_id and
-            _TOKEN_CACHE['client_secret'] == client_secret and
-            not self._should_refresh_token()):
-            
+
+        # Check if we should use cached token. The cache dict is replaced as a
+        # whole, never updated in place, so this lock-free read is consistent
+        cache = _TOKEN_CACHE
+        if self._token_is_current(cache, client_id, client_secret_hash):
             display.vvv("Using cached token")
+            return cache['token']
+
+        with _TOKEN_LOCK:
+            # Another thread may have refreshed the token while we waited
+            cache = _TOKEN_CACHE
+            if self._token_is_current(cache, client_id, client_secret_hash):
+                display.vvv("Using token refreshed by another thread")
+                return cache['token']
+
+            if _share_token_enabled(os.environ.get('HCP_SHARE_TOKEN')):
+                _TOKEN_CACHE = self._get_shared_token(client_id, client_secret, client_secret_hash)
+            else:
+                _TOKEN_CACHE = self._fetch_token(client_id, client_secret, client_secret_hash)
+
             return _TOKEN_CACHE['token']
 
-        # Get new token and cache it
+    def _fetch_token(self, client_id, client_secret, client_secret_hash):
+        """Request a new token and return it as a token cache entry."""
         display.vvv("Getting new token")
         token_data = self._get_token_from_credentials(client_id, client_secret)
-        
-        _TOKEN_CACHE.update({
+        return {
             'token': token_data['access_token'],
-            'issued_at': datetime.now(timezone.utc),
-            'expires_in': token_data['expires_in'],
+            # Refresh once two thirds of the token lifetime have passed
+            'refresh_after': time.monotonic() + float(token_data['expires_in']) * 2 / 3,
             'client_id': client_id,
-            'client_secret': client_secret
-        })
-        
-        return token_data['access_token']
+            'client_secret_hash': client_secret_hash
+        }
+
+    def _get_shared_token(self, client_id, client_secret, client_secret_hash):
+        """
+        Return a token cache entry shared with the other worker processes of this run.
+
+        The token is kept in a 0600 file in Ansible's per-run local temp directory,
+        named after the credentials' digest, and encrypted with a key derived from
+        the client secret, so the file alone never yields a usable bearer token.
+        An exclusive lock is held while it is read and, if stale, refreshed, so
+        forked workers request one token between them.
+        """
+        import fcntl
+        from ansible import constants as C
+
+        digest = hashlib.sha256(f"{client_id}:{client_secret_hash}".encode('utf-8')).hexdigest()
+        path = os.path.join(C.DEFAULT_LOCAL_TMP, f"hcp_token_{digest[:32]}.json")
+
+        # Keyed on the secret itself, which neither the file nor its name reveals
+        key = hmac.new(client_secret.encode('utf-8'), b'hcp-shared-token', hashlib.sha256).digest()
+        fernet = Fernet(base64.urlsafe_b64encode(key))
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    shared = json.load(f)
+                except ValueError:
+                    shared = {}
+
+                # Epoch time is used on disk since monotonic clocks are per process
+                remaining = shared.get('refresh_after_epoch', 0) - time.time()
+                token = None
+                if shared.get('token_encrypted') and shared.get('client_secret_hash') == client_secret_hash and remaining > 0:
+                    try:
+                        token = fernet.decrypt(shared['token_encrypted'].encode('ascii')).decode('utf-8')
+                    except (InvalidToken, UnicodeError):
+                        # Unreadable entries are simply replaced below
+                        token = None
+                if token:
+                    display.vvv("Using token shared by another worker")
+                    return {
+                        'token': token,
+                        'refresh_after': time.monotonic() + remaining,
+                        'client_id': client_id,
+                        'client_secret_hash': client_secret_hash
+                    }
+
+                entry = self._fetch_token(client_id, client_secret, client_secret_hash)
+                f.seek(0)
+                f.truncate()
+                json.dump({
+                    'token_encrypted': fernet.encrypt(entry['token'].encode('utf-8')).decode('ascii'),
+                    'refresh_after_epoch': time.time() + (entry['refresh_after'] - time.monotonic()),
+                    'client_secret_hash': client_secret_hash
+                }, f)
+                f.flush()
+                return entry
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
 
     def _get_token_from_credentials(self, client_id, client_secret):
         """Get HCP authentication token using client credentials OAuth2 flow with backoff."""
+        import requests
+
         auth_url = "https://auth.idp.hashicorp.com/oauth2/token"
         
-        data = {
+        # Encode the form body once rather than on every retry attempt
+        data = urlencode({
             'client_id': client_id,
             'client_secret': client_secret,
             'grant_type': 'client_credentials',
             'audience': 'https://api.hashicorp.cloud'
-        }
+        }).encode('ascii')
         
         headers = {
             'Content-Type': 'application/x-www-form-urlencoded'
@@ -125,38 +388,41 @@ class HCPLookup(LookupBase):
         max_retries = 10
         base_delay = 2
         max_delay = 64
+        # Wall-clock budget for obtaining a token, including every retry
+        budget = 180
+        deadline = time.monotonic() + budget
 
         for attempt in range(max_retries):
             try:
-                display.vvv(f"Attempting to get token from {auth_url}")
-                response = requests.post(auth_url, data=data, headers=headers)
-                display.vvv(f"Auth response status code: {response.status_code}")
+                if display.verbosity >= 3:
+                    display.vvv(f"Attempting to get token from {auth_url}")
+                if attempt == 0:
+                    # Retries are already spaced by the backoff below
+                    _pace_token_request()
+                response = _get_session().post(auth_url, data=data, headers=headers)
+                _record_token_response(response.status_code == 429)
+                if display.verbosity >= 3:
+                    display.vvv(f"Auth response status code: {response.status_code}")
                 
                 if response.status_code == 429:
                     if attempt == max_retries - 1:
                         raise AnsibleError('Maximum retry attempts reached for rate limit')
-                    
-                    # Check for Retry-After header
-                    retry_after = response.headers.get('Retry-After')
-                    if retry_after:
-                        try:
-                            delay = float(retry_after)
-                        except (ValueError, TypeError):
-                            # Fall back to exponential backoff if header is invalid
-                            delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
-                    else:
-                        # Use exponential backoff with jitter if no Retry-After header
-                        delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+
+                    delay = self._backoff_delay(attempt, response.headers.get('Retry-After'), base_delay, max_delay)
+                    delay = min(delay, deadline - time.monotonic())
+                    if delay <= 0:
+                        raise AnsibleError(f'Maximum retry attempts reached for rate limit ({budget}s token budget exhausted)')
                     
                     display.vvv(f"Rate limit exceeded. Retrying in {delay:.2f} seconds (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                     continue
 
                 if response.status_code != 200:
-                    display.vvv(f"Auth error response: {response.text}")
+                    if display.verbosity >= 3:
+                        display.vvv(f"Auth error response: {response.text}")
                     response.raise_for_status()
                 
-                json_response = response.json()
+                json_response = self._decode_json(response)
                 if not all(k in json_response for k in ['access_token', 'expires_in']):
                     raise KeyError('Response missing required fields')
                     
@@ -166,39 +432,172 @@ class HCPLookup(LookupBase):
             except requests.exceptions.RequestException as e:
                 if attempt == max_retries - 1:
                     raise AnsibleError(f'Failed to obtain token from client credentials: {str(e)}')
-                # Calculate delay for non-429 errors
-                delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                # Transient errors back off the same way, honouring any Retry-After sent with them
+                retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+                delay = self._backoff_delay(attempt, retry_after, base_delay, max_delay)
+                delay = min(delay, deadline - time.monotonic())
+                if delay <= 0:
+                    raise AnsibleError(f'Failed to obtain token from client credentials: {str(e)}')
                 time.sleep(delay)
                 continue
+            except AnsibleError:
+                raise
             except Exception as e:
                 raise AnsibleError(f'Unexpected error while obtaining token: {str(e)}')
 
+    def _backoff_delay(self, attempt, retry_after, base_delay, max_delay):
+        """
+        Compute the wait before the next attempt.
+
+        Capped exponential backoff plus jitter, never shorter than the server's
+        Retry-After. The jitter is independent of Retry-After so it still spreads
+        out clients that were all told to wait the same time. Retry-After is
+        itself capped at max_delay so a pathological header cannot stall a play.
+        """
+        computed = min(base_delay * (1 << attempt), max_delay)
+        jitter = random.uniform(0, base_delay)
+        retry_after_floor = parse_retry_after(retry_after, max_delay) or 0
+        return max(computed + jitter, retry_after_floor)
+
     def _get_headers(self, token):
-        """Get standard headers for HCP API."""
-        return {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        """Get standard headers for HCP API, reusing the dict built for the current token."""
+        if token is not self._cached_token:
+            self._cached_headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            self._cached_token = token
+        return self._cached_headers
+
+    def _format_endpoint(self, template, **parts):
+        """Fill an endpoint template, URL-quoting each part so it stays a single path segment."""
+        return template.format_map({key: quote(str(value), safe='') for key, value in parts.items()})
+
+    def _make_request(self, method, endpoint, variables, params=None, cacheable=False):
+        """Make request to HCP API.
+
+        When cacheable is set and the caller enabled hcp_cache, GET responses are
+        stored on disk with their ETag and revalidated with If-None-Match.
+        """
+        import requests
 
-    def _make_request(self, method, endpoint, variables, params=None):
-        """Make request to HCP API."""
         token = self._get_auth_token(variables)
         headers = self._get_headers(token)
-        url = f"{self.base_url}/{endpoint}"
+        url = build_url(self.base_url, endpoint)
+
+        cache_path = None
+        cached = None
+        if cacheable and method == 'GET' and str_to_bool(variables.get('hcp_cache', False)):
+            cache_path = self._cache_path(url, params)
+            cached = self._read_cache(cache_path)
+            if cached:
+                headers = dict(headers, **{'If-None-Match': cached['etag']})
 
         try:
-            display.vvv(f"Making {method} request to {url}")
+            if display.verbosity >= 3:
+                display.vvv(f"Making {method} request to {url}")
             if params:
-                display.vvv(f"With parameters: {json.dumps(params, indent=2)}")
+                self._vvv_json("With parameters", params)
                 
-            response = requests.request(method, url, headers=headers, params=params)
+            response = _get_session().request(method, url, headers=headers, params=params)
+            if cached and response.status_code == 304:
+                if display.verbosity >= 3:
+                    display.vvv(f"Not modified, using cached response for {url}")
+                return cached['body']
+
             response.raise_for_status()
-            return response.json()
+            body = self._decode_json(response)
+            if cache_path and response.headers.get('ETag'):
+                self._write_cache(cache_path, response.headers['ETag'], body)
+            return body
         except requests.exceptions.RequestException as e:
             raise AnsibleError(f'Error making request to HCP API: {str(e)}')
 
+    def _cache_path(self, url, params):
+        """Return the cache file used for a request URL and its query parameters."""
+        cache_dir = os.path.expanduser(os.environ.get('HCP_CACHE_DIR') or _DEFAULT_CACHE_DIR)
+        key = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _read_cache(self, path):
+        """Load a cached ETag and body, returning None when there is no usable entry."""
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not entry.get('etag') or 'body' not in entry:
+            return None
+        return entry
+
+    def _write_cache(self, path, etag, body):
+        """Atomically store a response body and its ETag, readable only by the current user."""
+        cache_dir = os.path.dirname(path)
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'etag': etag, 'body': body}, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # The cache is an optimization only; never fail the lookup over it
+            display.vvv(f"Could not write response cache {path}: {str(e)}")
+
+    def _make_concurrent_requests(self, endpoints, variables, max_workers=_MAX_WORKERS, cacheable=False):
+        """Issue GET requests for several endpoints in parallel, returning the responses in order."""
+        return self._map_concurrently(
+            lambda endpoint: self._make_request('GET', endpoint, variables, cacheable=cacheable),
+            endpoints,
+            variables,
+            max_workers
+        )
+
+    def _map_concurrently(self, func, items, variables, max_workers=_MAX_WORKERS):
+        """Apply func to each item on a thread pool sharing this process's session, returning results in order."""
+        if not items:
+            return []
+
+        # Resolve the token up front so the worker threads reuse it instead of each requesting one
+        self._get_auth_token(variables)
+
+        if len(items) == 1:
+            return [func(items[0])]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
     def _process_parameters(self, variables):
-        """Process and validate all query parameters including pagination."""
+        """
+        Process and validate all query parameters including pagination.
+
+        Results are memoized per instance on the parameters they depend on, so
+        repeated pagination runs (one per bucket, for example) validate once.
+        Callers receive fresh copies they are free to modify.
+        """
+        types = variables.get('types')
+        key = (
+            variables.get('page_size'),
+            variables.get('max_pages'),
+            variables.get('disable_pagination', False),
+            variables.get('name_contains'),
+            tuple(types) if isinstance(types, (list, tuple)) else types
+        )
+        try:
+            cached = self._param_cache.get(key)
+        except TypeError:
+            # Unhashable values cannot be memoized; validation will reject most of them
+            return self._build_parameters(variables)
+        if cached is None:
+            cached = self._param_cache[key] = self._build_parameters(variables)
+        query_params, pagination_config = cached
+        return dict(query_params), dict(pagination_config)
+
+    def _build_parameters(self, variables):
+        """Validate the pagination and filter variables, returning query_params and pagination_config."""
         query_params = {}
         pagination_config = {
             'enabled': not variables.get('disable_pagination', False),
@@ -206,43 +605,48 @@ class HCPLookup(LookupBase):
             'max_pages': None
         }
 
-        # Process pagination parameters
-        if 'page_size' in variables:
-            try:
-                page_size = int(variables['page_size'])
-                if page_size <= 0:
-                    raise ValueError("page_size must be positive")
-                pagination_config['page_size'] = page_size
-                query_params['pagination.page_size'] = page_size
-            except ValueError as e:
-                raise AnsibleError(f"Invalid page_size: {str(e)}")
-
-        if 'max_pages' in variables:
-            try:
-                max_pages = int(variables['max_pages'])
-                if max_pages <= 0:
-                    raise ValueError("max_pages must be positive")
-                pagination_config['max_pages'] = max_pages
-            except ValueError as e:
-                raise AnsibleError(f"Invalid max_pages: {str(e)}")
-
-        # Process standard filter parameters
-        if 'name_contains' in variables:
-            query_params['name_contains'] = variables['name_contains']
-
-        if 'types' in variables:
-            if isinstance(variables['types'], str):
-                query_params['types'] = variables['types'].split(',')
-            elif isinstance(variables['types'], (list, tuple)):
-                query_params['types'] = variables['types']
-            else:
-                raise AnsibleError(f"Invalid types parameter format: {variables['types']}")
-
-        display.vvv(f"Processed parameters: query_params={query_params}, "
-                   f"pagination_config={pagination_config}")
+        for name, parse, query_key, config_key in _PARAM_SPEC:
+            if name not in variables:
+                continue
+            value = parse(name, variables[name])
+            if query_key:
+                query_params[query_key] = value
+            if config_key:
+                pagination_config[config_key] = value
+
+        if display.verbosity >= 3:
+            display.vvv(f"Processed parameters: query_params={query_params}, "
+                        f"pagination_config={pagination_config}")
         
         return query_params, pagination_config
 
+    def _parse_fields(self, fields):
+        """Build a nested projection tree from a list or comma separated string of dotted field paths."""
+        if isinstance(fields, str):
+            fields = fields.split(',')
+
+        tree = {}
+        for path in fields:
+            node = tree
+            for part in str(path).strip().split('.'):
+                if part:
+                    node = node.setdefault(part, {})
+        return tree
+
+    def _project_fields(self, obj, tree):
+        """Keep only the fields named in a projection tree, applying it to every element of lists."""
+        if not tree:
+            return obj
+        if isinstance(obj, list):
+            return [self._project_fields(item, tree) for item in obj]
+        if isinstance(obj, dict):
+            return {
+                key: self._project_fields(obj[key], subtree)
+                for key, subtree in tree.items()
+                if key in obj
+            }
+        return obj
+
     def _validate_params(self, terms, variables, required_params):
         """Validate required parameters are present."""
         for param in required_params:
@@ -250,7 +654,14 @@ class HCPLookup(LookupBase):
                 raise AnsibleError(f'Missing required parameter: {param}')
 
     def _handle_pagination(self, endpoint, variables, query_params=None):
-        """Handle paginated requests with configurable behavior."""
+        """
+        Handle paginated requests with configurable behavior.
+
+        When hcp_cache_ttl is set, complete listings are kept in a short-lived
+        process cache for that many seconds; by default nothing is cached. A
+        repeat listing that differs only in order_by is sorted client-side from
+        the cached results instead of paginating again.
+        """
         # Process parameters
         params, pagination_config = self._process_parameters(variables)
         if query_params:
@@ -261,6 +672,82 @@ class HCPLookup(LookupBase):
             response = self._make_request('GET', endpoint, variables, params)
             return self._extract_results(response)
 
+        try:
+            ttl = float(variables.get('hcp_cache_ttl', _RESULT_CACHE_TTL))
+        except (TypeError, ValueError):
+            raise AnsibleError(f"Invalid hcp_cache_ttl: {variables.get('hcp_cache_ttl')}")
+
+        order_by = params.pop('sorting.order_by', None)
+        cache_key = self._result_cache_key(endpoint, variables, params, pagination_config) if ttl > 0 else None
+
+        if cache_key is not None:
+            with _RESULT_CACHE_LOCK:
+                entry = _RESULT_CACHE.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                cached_order_by, results = entry[1], entry[2]
+                if order_by == cached_order_by:
+                    if display.verbosity >= 3:
+                        display.vvv(f"Using cached results for {endpoint}")
+                    return {'results': copy.deepcopy(results)}
+                if order_by:
+                    if display.verbosity >= 3:
+                        display.vvv(f"Sorting cached results for {endpoint} by {order_by}")
+                    return {'results': self._sort_results(copy.deepcopy(results), order_by)}
+
+        if order_by is not None:
+            params['sorting.order_by'] = order_by
+
+        all_results, exhausted = self._fetch_pages(endpoint, variables, params, pagination_config)
+
+        # Only listings fetched to their last page are cached; one cut short by
+        # max_pages or a failed page cannot be reused, let alone re-sorted
+        if cache_key is not None and exhausted:
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[cache_key] = (time.monotonic() + ttl, order_by, copy.deepcopy(all_results))
+
+        return {'results': all_results}
+
+    def _result_cache_key(self, endpoint, variables, params, pagination_config):
+        """Identify a complete listing by endpoint, credentials, filters and page limits."""
+        try:
+            token, client_id, _client_secret, client_secret_hash = self._resolve_credentials(variables)
+        except AnsibleError:
+            # Without credentials the request itself will fail; there is nothing to cache
+            return None
+        identity = (hashlib.sha256(token.encode('utf-8')).hexdigest() if token else None,
+                    client_id, client_secret_hash)
+        filters = tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in params.items()
+        ))
+        return (self.base_url, endpoint, identity, filters, pagination_config['max_pages'])
+
+    def _sort_results(self, results, order_by):
+        """
+        Sort results client-side by an HCP order_by expression such as 'name desc,created_at'.
+
+        Like the sorting.order_by query parameter, order_by may be a string or a
+        list of them, and each entry may hold several comma separated clauses.
+        """
+        entries = order_by if isinstance(order_by, (list, tuple)) else [order_by]
+        clauses = [c.split() for entry in entries for c in str(entry).split(',') if c.strip()]
+        ordered = list(results)
+        # Apply the sort keys from least to most significant, relying on sort stability
+        for clause in reversed(clauses):
+            field = clause[0]
+            descending = len(clause) > 1 and clause[1].lower() == 'desc'
+            ordered.sort(
+                key=lambda item: (item.get(field) is None, item.get(field)) if isinstance(item, dict) else (True, None),
+                reverse=descending
+            )
+        return ordered
+
+    def _fetch_pages(self, endpoint, variables, params, pagination_config):
+        """
+        Follow next_page_token links, returning the combined results and whether
+        the listing was fetched to its last page; that is False after a failed
+        page or when max_pages stops it.
+        """
         all_results = []
         next_token = None
         page_count = 0
@@ -270,9 +757,9 @@ class HCPLookup(LookupBase):
             # Increment page counter
             page_count += 1
 
-            # Check max_pages limit
+            # Check max_pages limit; there is a next page, so the listing is cut short
             if max_pages and page_count > max_pages:
-                break
+                return all_results, False
 
             # Set next page token if we have one
             if next_token:
@@ -282,26 +769,26 @@ class HCPLookup(LookupBase):
             try:
                 response = self._make_request('GET', endpoint, variables, params)
                 page_results = self._extract_results(response)
-                
-                if 'results' in page_results:
-                    all_results.extend(page_results['results'])
-                else:
-                    display.warning(f"Unexpected response structure: {response}")
-                    break
-
-                # Check for next page token
-                pagination = response.get('pagination', {})
-                next_token = pagination.get('next_page_token')
-                
-                # Break if no next token
-                if not next_token:
-                    break
-
             except Exception as e:
                 display.warning(f"Error processing page {page_count}: {str(e)}")
-                break
+                return all_results, False
 
-        return {'results': all_results}
+            if 'results' not in page_results:
+                keys = list(response)[:20] if isinstance(response, dict) else type(response).__name__
+                display.warning(f"Unexpected response structure (keys={keys})")
+                self._vvv_json("Unexpected response body", response)
+                return all_results, False
+
+            all_results.extend(page_results['results'])
+
+            # Check for next page token. A short page is not proof of the last
+            # one: the server may serve fewer items than the requested page_size
+            pagination = response.get('pagination', {}) if isinstance(response, dict) else {}
+            next_token = pagination.get('next_page_token')
+            
+            # Stop if no next token
+            if not next_token:
+                return all_results, True
 
     def _extract_results(self, response):
         """Extract results from response using known patterns."""
@@ -310,17 +797,16 @@ class HCPLookup(LookupBase):
             return {'results': response}
 
         # Check for known result keys
-        result_keys = ['apps', 'secrets', 'secret', 'integrations', 'version', 'versions','channel', 'channels', 'bucket', 'buckets']
-        for key in result_keys:
-            if key in response:
-                return {'results': response[key]}
+        hits = _RESULT_KEYS.intersection(response)
+        if hits:
+            key = next(iter(hits)) if len(hits) == 1 else next(k for k in _RESULT_KEY_ORDER if k in hits)
+            return {'results': response[key]}
 
         # If we have pagination metadata but results are at root level
-        if 'pagination' in response:
+        if 'pagination' in response and len(response) > 1:
             # Create a new dict excluding pagination
             results = {k: v for k, v in response.items() if k != 'pagination'}
-            if results:
-                return {'results': [results]}
+            return {'results': [results]}
 
         # Return empty results if no pattern matched
-        return {'results': []}
\ No newline at end of file
+        return {'results': []}
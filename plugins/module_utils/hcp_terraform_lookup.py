@@ -1,14 +1,60 @@
 from ansible.plugins.lookup import LookupBase
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import SharedSession, build_url, decode_json, full_jitter_backoff, parse_retry_after
+import copy
+import hashlib
 import os
 import requests
 import sys
 import time
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 display = Display()
 
+# Upper bound on concurrent page fetches; kept within the session's pool size
+_MAX_WORKERS = 8
+
+# Largest page the Terraform API will return
+_MAX_PAGE_SIZE = 100
+
+# Complete listings kept briefly so repeat lookups in one worker skip the API.
+# Opt-in through cache_ttl, so a lookup after a change never sees stale data
+_RESPONSE_CACHE = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_TTL = 0
+
+# Connection pool size of the shared session, overridable with TFE_HCP_POOL_MAXSIZE
+_DEFAULT_POOL_MAXSIZE = 32
+
+
+def _session_settings():
+    """Adapter settings for the shared session, read when it is built."""
+    try:
+        pool_maxsize = int(os.environ.get('TFE_HCP_POOL_MAXSIZE', _DEFAULT_POOL_MAXSIZE))
+    except ValueError:
+        raise AnsibleError(f"Invalid TFE_HCP_POOL_MAXSIZE: {os.environ.get('TFE_HCP_POOL_MAXSIZE')}")
+    return dict(
+        pool_connections=8,
+        # The pool must hold at least one connection per pagination worker
+        pool_maxsize=max(pool_maxsize, _MAX_WORKERS),
+        max_retries=0
+    )
+
+
+# Module level HTTP session, shared by every Terraform lookup in this worker
+# so consecutive tasks reuse pooled keep-alive connections. Only transport
+# settings live on it; authentication headers are sent with each request
+# because different lookups may use different tokens.
+_SHARED_SESSION = SharedSession(_session_settings)
+
+
+def _get_session():
+    """Return the shared requests session for this process."""
+    return _SHARED_SESSION.get()
+
+
 class HCPTerraformLookup(LookupBase):
     """Base class for HCP Terraform lookup plugins."""
     
@@ -16,6 +62,10 @@ class HCPTerraformLookup(LookupBase):
         """Initialize the base class with common configuration."""
         super().__init__(*args, **kwargs)
         self.base_url = None  # Will be set during run() based on hostname
+        self._resolved_token = None
+        self._resolved_hostname = None
+        self._cached_token = None
+        self._cached_headers = None
         
         # Warn macOS users about potential fork() safety issues
         if sys.platform == 'darwin' and 'OBJC_DISABLE_INITIALIZE_FORK_SAFETY' not in os.environ:
@@ -25,24 +75,33 @@ class HCPTerraformLookup(LookupBase):
             )
 
     def _get_headers(self, token):
-        """Return authentication headers for API requests."""
-        return {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/vnd.api+json"
-        }
+        """Return authentication headers for API requests, reusing the dict built for the current token."""
+        if token is not self._cached_token:
+            # Lookups only read, so no Content-Type is sent
+            self._cached_headers = {"Authorization": f"Bearer {token}"}
+            self._cached_token = token
+        return self._cached_headers
 
     def _get_auth_token(self, variables):
         """
         Get authentication token for HCP Terraform using this precedence:
         1. Variables: token parameter
         2. Environment: TFE_TOKEN
+
+        The result is remembered for the variables mapping last seen, so the
+        pages of a listing do not repeat the variable and environment lookups.
         """
+        cached = self._resolved_token
+        if cached is not None and cached[0] is variables:
+            return cached[1]
+
         token = variables.get('token') or os.environ.get('TFE_TOKEN')
         if not token:
             raise AnsibleError(
                 'No valid authentication found. Please set either token parameter '
                 'or TFE_TOKEN environment variable.'
             )
+        self._resolved_token = (variables, token)
         return token
 
     def _get_hostname(self, variables):
@@ -52,50 +111,49 @@ class HCPTerraformLookup(LookupBase):
         2. Environment: TFE_HOSTNAME
         3. Default: https://app.terraform.io
         """
+        cached = self._resolved_hostname
+        if cached is not None and cached[0] is variables:
+            return cached[1]
+
         hostname = variables.get('hostname') or os.environ.get('TFE_HOSTNAME', 'https://app.terraform.io')
         # Ensure we're using the API v2 endpoint
         if not hostname.endswith('/api/v2'):
-            return hostname.rstrip('/') + '/api/v2'
+            hostname = hostname.rstrip('/') + '/api/v2'
+        self._resolved_hostname = (variables, hostname)
         return hostname
 
     def _make_request(self, method, endpoint, variables, params=None, max_retries=5):
         """Make request to HCP Terraform API with retries."""
         token = self._get_auth_token(variables)
         headers = self._get_headers(token)
-        
-        # Handle endpoint with or without leading slash
-        if endpoint.startswith('/'):
-            url = f"{self.base_url}{endpoint}"
-        else:
-            url = f"{self.base_url}/{endpoint}"
+        url = build_url(self.base_url, endpoint)
+        return self._send_request(method, url, headers, params, max_retries)
 
+    def _send_request(self, method, url, headers, params=None, max_retries=5):
+        """Send a request to an already resolved URL with prebuilt headers, retrying as needed."""
         base_delay = 2
         max_delay = 64
 
         for attempt in range(max_retries):
             try:
-                display.vvv(f"Making {method} request to {url}")
-                if params:
-                    display.vvv(f"With parameters: {params}")
+                # Skip formatting entirely unless -vvv will actually show it
+                if display.verbosity >= 3:
+                    display.vvv(f"Making {method} request to {url}")
+                    if params:
+                        display.vvv(f"With parameters: {params}")
                     
-                response = requests.request(method, url, headers=headers, params=params)
+                response = _get_session().request(method, url, headers=headers, params=params)
                 
                 # Handle rate limiting
                 if response.status_code == 429:
                     if attempt == max_retries - 1:
                         raise AnsibleError('Maximum retry attempts reached for rate limit (429 Too Many Requests)')
                     
-                    # Check for Retry-After header
-                    retry_after = response.headers.get('Retry-After')
-                    if retry_after:
-                        try:
-                            delay = float(retry_after)
-                        except (ValueError, TypeError):
-                            # Fall back to exponential backoff if header is invalid
-                            delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
-                    else:
-                        # Use exponential backoff with jitter if no Retry-After header
-                        delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                    # Honour Retry-After, in seconds or as an HTTP-date
+                    delay = parse_retry_after(response.headers.get('Retry-After'), max_delay)
+                    if delay is None:
+                        # Use exponential backoff with jitter if the header is missing or invalid
+                        delay = full_jitter_backoff(attempt, base_delay, max_delay)
                     
                     display.vvv(f"Rate limit exceeded. Retrying in {delay:.2f} seconds (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
@@ -103,7 +161,7 @@ class HCPTerraformLookup(LookupBase):
                 
                 # Handle server errors with retry
                 if response.status_code in [500, 502, 503, 504] and attempt < max_retries - 1:
-                    delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                    delay = full_jitter_backoff(attempt, base_delay, max_delay)
                     display.vvv(f"Server error {response.status_code}. Retrying in {delay:.2f} seconds")
                     time.sleep(delay)
                     continue
@@ -112,15 +170,18 @@ class HCPTerraformLookup(LookupBase):
                 response.raise_for_status()
                 
                 # Return JSON response if content exists
-                if response.text:
-                    return response.json()
-                return {}
+                return decode_json(response, {})
                 
             except requests.exceptions.RequestException as e:
+                # Client errors other than 429 (bad token, missing resource, invalid
+                # filter) cannot succeed on retry, so report them straight away
+                status_code = getattr(e.response, 'status_code', None)
+                if isinstance(status_code, int) and 400 <= status_code < 500 and status_code != 429:
+                    raise AnsibleError(f'Error making request to HCP Terraform API: {str(e)}')
                 if attempt == max_retries - 1:
                     raise AnsibleError(f'Error making request to HCP Terraform API: {str(e)}')
                 # Calculate delay for non-429 errors
-                delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                delay = full_jitter_backoff(attempt, base_delay, max_delay)
                 time.sleep(delay)
                 continue
             except Exception as e:
@@ -159,9 +220,13 @@ class HCPTerraformLookup(LookupBase):
         if page_size:
             try:
                 page_size = int(page_size)
-                query_params['page[size]'] = page_size
             except ValueError:
                 raise AnsibleError(f"Invalid page_size: {page_size}")
+            query_params['page[size]'] = min(max(page_size, 1), _MAX_PAGE_SIZE)
+        else:
+            # The API defaults to 20 per page; asking for its maximum means
+            # far fewer round trips for the same listing
+            query_params.setdefault('page[size]', _MAX_PAGE_SIZE)
                     
         max_pages = variables.get('max_pages')
         if max_pages:
@@ -169,10 +234,48 @@ class HCPTerraformLookup(LookupBase):
                 max_pages = int(max_pages)
             except ValueError:
                 raise AnsibleError(f"Invalid max_pages: {max_pages}")
-        
+
+        try:
+            ttl = float(variables.get('cache_ttl', _RESPONSE_CACHE_TTL))
+        except (TypeError, ValueError):
+            raise AnsibleError(f"Invalid cache_ttl: {variables.get('cache_ttl')}")
+
+        cache_key = self._response_cache_key(endpoint, variables, query_params, max_pages) if ttl > 0 else None
+        if cache_key is not None:
+            with _RESPONSE_CACHE_LOCK:
+                entry = _RESPONSE_CACHE.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                display.vvv(f"Using cached response for {endpoint}")
+                return copy.deepcopy(entry[1])
+
+        response, complete = self._fetch_listing(endpoint, variables, query_params, max_pages)
+
+        # Listings cut short by a failed page are not cached
+        if cache_key is not None and complete:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[cache_key] = (time.monotonic() + ttl, copy.deepcopy(response))
+        return response
+
+    def _response_cache_key(self, endpoint, variables, query_params, max_pages):
+        """Identify a listing by host, endpoint, token, query and page limits."""
+        try:
+            token = self._get_auth_token(variables)
+        except AnsibleError:
+            return None
+        return (
+            self.base_url,
+            endpoint,
+            hashlib.sha256(str(token).encode('utf-8')).hexdigest(),
+            tuple(sorted((str(k), str(v)) for k, v in query_params.items())),
+            max_pages,
+            bool(variables.get('disable_pagination', False))
+        )
+
+    def _fetch_listing(self, endpoint, variables, query_params, max_pages):
+        """Fetch a listing, returning the combined response and whether every page was retrieved."""
         # If pagination is disabled, make single request
         if variables.get('disable_pagination', False):
-            return self._make_request('GET', endpoint, variables, query_params)
+            return self._make_request('GET', endpoint, variables, query_params), True
 
         # For API endpoints that return collections, we'll combine the data arrays
         # but preserve the rest of the response structure
@@ -180,7 +283,7 @@ class HCPTerraformLookup(LookupBase):
         
         # If the response doesn't have pagination info, return the raw response
         if 'meta' not in response or 'pagination' not in response['meta']:
-            return response
+            return response, True
         
         # Extract pagination info
         pagination = response['meta']['pagination']
@@ -193,31 +296,45 @@ class HCPTerraformLookup(LookupBase):
         
         # If there's only one page, return the response as is
         if total_pages <= 1:
-            return response
+            return response, True
         
         # For paginated results, we'll combine the data arrays
-        all_data = response.get('data', [])
-        
-        # Continue paginating if needed
-        while current_page < total_pages:
-            current_page += 1
-            query_params['page[number]'] = current_page
-            
-            try:
-                page_response = self._make_request('GET', endpoint, variables, query_params)
-                if 'data' in page_response and isinstance(page_response['data'], list):
-                    all_data.extend(page_response['data'])
-            except Exception as e:
-                display.warning(f"Error processing page {current_page}: {str(e)}")
-                break
-        
-        # Create a copy of the original response
-        combined_response = response.copy()
-        # Replace the data array with our combined one
-        combined_response['data'] = all_data
-        # Update the pagination info
-        if 'meta' in combined_response and 'pagination' in combined_response['meta']:
-            combined_response['meta']['pagination']['current-page'] = total_pages
-            combined_response['meta']['pagination']['next-page'] = None
+        # Copied so the first page's own list is never extended in place
+        all_data = list(response.get('data', []))
+
+        # Authentication and the URL are the same for every remaining page
+        headers = self._get_headers(self._get_auth_token(variables))
+        url = build_url(self.base_url, endpoint)
+
+        def fetch_page(page_number):
+            page_params = dict(query_params)
+            page_params['page[number]'] = page_number
+            return self._send_request('GET', url, headers, page_params)
+
+        # The page count is known from the first response, so the remaining
+        # pages are fetched concurrently and combined in page order
+        pages = range(current_page + 1, total_pages + 1)
+        complete = True
+        if pages:
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(pages))) as executor:
+                futures = [executor.submit(fetch_page, page_number) for page_number in pages]
+                for page_number, future in zip(pages, futures):
+                    try:
+                        page_response = future.result()
+                        if 'data' in page_response and isinstance(page_response['data'], list):
+                            all_data.extend(page_response['data'])
+                    except Exception as e:
+                        display.warning(f"Error processing page {page_number}: {str(e)}")
+                        complete = False
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        # Build the combined response from fresh dicts so the first page's
+        # nested meta/pagination mappings are left untouched
+        combined_response = dict(response, data=all_data)
+        combined_response['meta'] = dict(response['meta'], pagination=dict(
+            pagination, **{'current-page': total_pages, 'next-page': None}
+        ))
         
-        return combined_response
\ No newline at end of file
+        return combined_response, complete
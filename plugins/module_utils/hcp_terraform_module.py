@@ -3,8 +3,32 @@ import os
 import requests
 import sys
 import time
-import random
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import build_url, decode_json, encode_json, full_jitter_backoff, parse_retry_after
+
+# (connect, read) seconds for every API request; without a timeout requests
+# waits forever and a stalled connection would hang the task
+_TIMEOUT = (10, 60)
+
+# Transient server-side statuses worth retrying; 429 is handled separately
+# because it carries a Retry-After header
+_RETRY_STATUSES = frozenset((408, 500, 503))
+
+# Gateway errors leave it unknown whether the request reached the API, so
+# they are only retried for methods that are safe to repeat
+_GATEWAY_RETRY_STATUSES = frozenset((502, 504))
+_IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE'))
+
+class HCPTerraformApiError(Exception):
+    """An error response from the HCP Terraform API, carrying its HTTP status code."""
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class HCPNotFoundError(HCPTerraformApiError):
+    """The requested HCP Terraform resource does not exist (HTTP 404)."""
+
 
 class HCPTerraformModule(AnsibleModule):
     """
@@ -34,38 +58,56 @@ class HCPTerraformModule(AnsibleModule):
                 "if you encounter fork()-related crashes\n"
             )
 
+    # JSON:API media type, sent only on requests that carry a body
+    _BODY_HEADERS = {"Content-Type": "application/vnd.api+json"}
+
     def _get_headers(self):
         """
         Return authentication headers for API requests.
         """
         return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/vnd.api+json"
+            "Authorization": f"Bearer {self.token}"
         }
 
+    def _get_session(self):
+        """
+        Return the HTTP session for this module run, creating it on first use.
+        Requests share pooled keep-alive connections and the authentication
+        headers are set once on the session rather than on every call.
+        """
+        session = getattr(self, '_session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0))
+            session.headers.update(self._get_headers())
+            self._session = session
+        return session
+
     def _request(self, method, endpoint, data=None, params=None, max_retries=10):
         """
         Perform an API request to HCP Terraform with exponential backoff.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        url = build_url(self.base_url, endpoint)
+        session = self._get_session()
         base_delay = 2
         max_delay = 64
 
+        # Serialize the payload once, compactly, rather than on every attempt
+        body = encode_json(data) if data is not None else None
+
         for attempt in range(max_retries):
             try:
-                response = requests.request(method, url, headers=headers, json=data, params=params)
+                response = session.request(
+                    method, url, data=body, params=params,
+                    headers=self._BODY_HEADERS if body is not None else None,
+                    timeout=_TIMEOUT
+                )
                 if response.status_code == 429:
                     if attempt == max_retries - 1:
                         raise Exception("Maximum retry attempts reached for rate limit (429 Too Many Requests).")
-                    retry_after = response.headers.get('Retry-After')
-                    if retry_after:
-                        try:
-                            delay = float(retry_after)
-                        except (ValueError, TypeError):
-                            delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
-                    else:
-                        delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                    delay = parse_retry_after(response.headers.get('Retry-After'), max_delay)
+                    if delay is None:
+                        delay = full_jitter_backoff(attempt, base_delay, max_delay)
                     sys.stderr.write(
                         f"WARNING: Rate limit exceeded. Retrying in {delay:.2f} seconds (attempt {attempt+1}/{max_retries})\n"
                     )
@@ -73,19 +115,23 @@ class HCPTerraformModule(AnsibleModule):
                     continue
 
                 response.raise_for_status()
-                return response.json() if response.text else None
+                return decode_json(response)
 
             except requests.exceptions.HTTPError as errh:
                 status_code = errh.response.status_code
-                if status_code in [500, 503, 408] and attempt < max_retries - 1:
-                    delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
+                retryable = status_code in _RETRY_STATUSES or (
+                    status_code in _GATEWAY_RETRY_STATUSES and method.upper() in _IDEMPOTENT_METHODS
+                )
+                if retryable and attempt < max_retries - 1:
+                    delay = full_jitter_backoff(attempt, base_delay, max_delay)
                     sys.stderr.write(
                         f"WARNING: Received {status_code}. Retrying in {delay:.2f} seconds (attempt {attempt+1}/{max_retries})\n"
                     )
                     time.sleep(delay)
                     continue
                 else:
-                    raise Exception(f"HTTP Error: {status_code} - {errh.response.text}")
+                    error = HCPNotFoundError if status_code == 404 else HCPTerraformApiError
+                    raise error(status_code, f"HTTP Error: {status_code} - {errh.response.text}")
             except requests.exceptions.ConnectionError:
                 raise Exception("Error: Unable to connect to Terraform API.")
             except requests.exceptions.Timeout:
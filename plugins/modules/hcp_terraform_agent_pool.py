@@ -140,7 +140,7 @@ result:
           type: dict
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformAgentPoolModule(HCPTerraformModule):
     def __init__(self):
@@ -182,18 +182,17 @@ class TerraformAgentPoolModule(HCPTerraformModule):
             endpoint = f"/agent-pools/{self.id}"
             response = self._request("GET", endpoint)
             return response
-        except Exception as e:
+        except HCPNotFoundError:
             # If the agent pool doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _get_agent_pool_by_name(self):
         """Retrieve the agent pool from HCP Terraform by name if it exists."""
         try:
             endpoint = f"/organizations/{self.organization}/agent-pools"
-            response = self._request("GET", endpoint)
+            # Let the API narrow the listing by name; q is a substring search,
+            # so the exact match is still confirmed below
+            response = self._request("GET", endpoint, params={"q": self.name, "page[size]": 100})
             
             if 'data' in response:
                 # Find the agent pool by name
@@ -202,12 +201,9 @@ class TerraformAgentPoolModule(HCPTerraformModule):
                         return {'data': pool}
             # If no matching agent pool found
             return None
-        except Exception as e:
+        except HCPNotFoundError:
             # If the organization doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _get_agent_pool(self):
         """Get the agent pool by ID if provided, otherwise by name."""
@@ -216,41 +212,32 @@ class TerraformAgentPoolModule(HCPTerraformModule):
         else:
             return self._get_agent_pool_by_name()
 
-    def _create_agent_pool(self):
-        """Create a new agent pool in HCP Terraform."""
-        endpoint = f"/organizations/{self.organization}/agent-pools"
-        
-        # Prepare the attributes
-        attributes = {
-            "name": self.name,
-            "organization-scoped": self.organization_scoped
-        }
-        
-        # Build the payload
-        payload = {
-            "data": {
-                "type": "agent-pools",
-                "attributes": attributes
+    def _build_payload(self, agent_pool_id=None):
+        """Build the JSON:API payload for creating or updating the agent pool."""
+        data = {
+            "type": "agent-pools",
+            "attributes": {
+                "name": self.name,
+                "organization-scoped": self.organization_scoped
             }
         }
+        if agent_pool_id:
+            data["id"] = agent_pool_id
         
         # Add allowed workspaces if organization scoped is False
         if not self.organization_scoped and self.allowed_workspaces:
-            allowed_workspaces_data = []
-            for workspace_id in self.allowed_workspaces:
-                allowed_workspaces_data.append({
-                    "id": workspace_id,
-                    "type": "workspaces"
-                })
-            
-            payload["data"]["relationships"] = {
+            data["relationships"] = {
                 "allowed-workspaces": {
-                    "data": allowed_workspaces_data
+                    "data": [{"id": workspace_id, "type": "workspaces"} for workspace_id in self.allowed_workspaces]
                 }
             }
-            
-        # Make the API request
-        response = self._request("POST", endpoint, data=payload)
+        
+        return {"data": data}
+
+    def _create_agent_pool(self):
+        """Create a new agent pool in HCP Terraform."""
+        endpoint = f"/organizations/{self.organization}/agent-pools"
+        response = self._request("POST", endpoint, data=self._build_payload())
         return response
 
     def _update_agent_pool(self, agent_pool):
@@ -260,39 +247,7 @@ class TerraformAgentPoolModule(HCPTerraformModule):
             self.fail_json(msg="Failed to get agent pool ID from existing agent pool")
             
         endpoint = f"/agent-pools/{agent_pool_id}"
-        
-        # Prepare the attributes
-        attributes = {
-            "name": self.name,
-            "organization-scoped": self.organization_scoped
-        }
-        
-        # Build the payload
-        payload = {
-            "data": {
-                "type": "agent-pools",
-                "id": agent_pool_id,
-                "attributes": attributes
-            }
-        }
-        
-        # Add allowed workspaces if organization scoped is False
-        if not self.organization_scoped and self.allowed_workspaces:
-            allowed_workspaces_data = []
-            for workspace_id in self.allowed_workspaces:
-                allowed_workspaces_data.append({
-                    "id": workspace_id,
-                    "type": "workspaces"
-                })
-            
-            payload["data"]["relationships"] = {
-                "allowed-workspaces": {
-                    "data": allowed_workspaces_data
-                }
-            }
-        
-        # Make the API request
-        response = self._request("PATCH", endpoint, data=payload)
+        response = self._request("PATCH", endpoint, data=self._build_payload(agent_pool_id))
         return response
 
     def _delete_agent_pool(self, agent_pool):
@@ -329,9 +284,41 @@ class TerraformAgentPoolModule(HCPTerraformModule):
             
         return formatted
 
+    def _delete_by_id(self):
+        """
+        Delete the agent pool with a known ID without looking it up first.
+        The DELETE reports whether the pool exists; a 404 means it is already absent.
+        """
+        try:
+            result = self._delete_agent_pool({"data": {"id": self.id}})
+        except HCPNotFoundError:
+            self.exit_json(
+                changed=False,
+                msg=f"Agent pool '{self.name}' already does not exist",
+                result={"deleted": False}
+            )
+            return
+        self.exit_json(**result, result={"deleted": True})
+
+    def _needs_update(self, agent_pool):
+        """Check whether the existing agent pool differs from the requested configuration."""
+        current = self._format_agent_pool_output(agent_pool)
+        if current["name"] != self.name or current["organization_scoped"] != self.organization_scoped:
+            return True
+        # Allowed workspaces are only managed for pools that are not organization scoped
+        if not self.organization_scoped:
+            return set(current.get("allowed_workspaces", [])) != set(self.allowed_workspaces or [])
+        return False
+
     def run(self):
         """Main module execution logic."""
         try:
+            # With a known ID the DELETE itself reveals whether the pool
+            # exists, so the preliminary GET is only needed in check mode
+            if self.id and self.state == 'absent' and not self.check_mode:
+                self._delete_by_id()
+                return
+
             # Get the current agent pool state
             agent_pool = self._get_agent_pool()
             
@@ -339,7 +326,7 @@ class TerraformAgentPoolModule(HCPTerraformModule):
             if self.check_mode:
                 if self.state == 'present' and not agent_pool:
                     self.exit_json(changed=True, msg=f"Would create agent pool '{self.name}'")
-                elif self.state == 'present' and agent_pool:
+                elif self.state == 'present' and agent_pool and self._needs_update(agent_pool):
                     self.exit_json(changed=True, msg=f"Would update agent pool '{self.name}'")
                 elif self.state == 'absent' and agent_pool:
                     self.exit_json(changed=True, msg=f"Would delete agent pool '{self.name}'")
@@ -357,6 +344,14 @@ class TerraformAgentPoolModule(HCPTerraformModule):
                         agent_pool=self._format_agent_pool_output(response),
                         result=response
                     )
+                elif not self._needs_update(agent_pool):
+                    # Already configured as requested, so skip the PATCH
+                    self.exit_json(
+                        changed=False,
+                        msg=f"Agent pool '{self.name}' is already up to date",
+                        agent_pool=self._format_agent_pool_output(agent_pool),
+                        result=agent_pool
+                    )
                 else:
                     # Update an existing agent pool
                     response = self._update_agent_pool(agent_pool)
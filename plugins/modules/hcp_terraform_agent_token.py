@@ -113,7 +113,7 @@ result:
           type: dict
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformAgentTokenModule(HCPTerraformModule):
     def __init__(self):
@@ -150,12 +150,9 @@ class TerraformAgentTokenModule(HCPTerraformModule):
             endpoint = f"/authentication-tokens/{token_id}"
             response = self._request("GET", endpoint)
             return response
-        except Exception as e:
+        except HCPNotFoundError:
             # If the token doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _list_agent_tokens(self):
         """List all agent tokens for the agent pool."""
@@ -238,19 +235,18 @@ class TerraformAgentTokenModule(HCPTerraformModule):
                     result=response
                 )
             else:  # state == 'absent'
-                # Check if the token exists
-                token = self._get_agent_token(self.token_id)
-                if token:
-                    # Delete the token
+                # Delete directly rather than looking the token up first;
+                # a 404 means it is already gone
+                try:
                     result = self._delete_agent_token(self.token_id)
-                    self.exit_json(**result, result={"deleted": True})
-                else:
-                    # Token already doesn't exist
+                except HCPNotFoundError:
                     self.exit_json(
                         changed=False,
                         msg=f"Agent token '{self.token_id}' already does not exist",
                         result={"deleted": False}
                     )
+                    return
+                self.exit_json(**result, result={"deleted": True})
                     
         except Exception as e:
             self.fail_json(msg=f"Error managing agent token: {str(e)}")
@@ -65,6 +65,14 @@ options:
     required: false
     type: bool
     default: false
+  try_update_first:
+    description:
+      - "When state is present, send the update straight away instead of looking the organization up first, and create it only if the update reports that it does not exist."
+      - "This saves a round-trip for organizations that usually exist already, but the module then always reports a change."
+      - "Ignored in check mode."
+    required: false
+    type: bool
+    default: false
   state:
     description: "Whether the organization should exist or not."
     required: false
@@ -169,9 +177,23 @@ result:
           type: dict
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformOrganizationModule(HCPTerraformModule):
+    # (module parameter, API attribute, whether the value should be sent).
+    # Strings are sent when non-empty, booleans and numbers whenever set.
+    _ATTR_MAP = (
+        ('email', 'email', bool),
+        ('description', 'description', bool),
+        ('session_timeout', 'session-timeout', lambda v: v is not None),
+        ('session_remember', 'session-remember', lambda v: v is not None),
+        ('collaborator_auth_policy', 'collaborator-auth-policy', bool),
+        ('cost_estimation_enabled', 'cost-estimation-enabled', lambda v: v is not None),
+        ('assessments_enforced', 'assessments-enforced', lambda v: v is not None),
+        ('default_execution_mode', 'default-execution-mode', bool),
+        ('allow_force_delete_workspaces', 'allow-force-delete-workspaces', lambda v: v is not None),
+    )
+
     def __init__(self):
         # Define the argument specification for this module.
         argument_spec = dict(
@@ -197,6 +219,7 @@ class TerraformOrganizationModule(HCPTerraformModule):
                 default='remote'
             ),
             allow_force_delete_workspaces=dict(type='bool', required=False, default=False),
+            try_update_first=dict(type='bool', required=False, default=False),
             state=dict(type='str', required=False, choices=['present', 'absent'], default='present')
         )
         
@@ -211,52 +234,38 @@ class TerraformOrganizationModule(HCPTerraformModule):
         self.email = self.params.get('email')
         self.state = self.params.get('state')
 
+    def _build_attributes(self):
+        """Map the set module parameters onto their API attribute names."""
+        params = self.params
+        attributes = {}
+        for param, api_key, keep in self._ATTR_MAP:
+            value = params.get(param)
+            if keep(value):
+                attributes[api_key] = value
+        return attributes
+
     def _get_organization(self):
         """Retrieve the organization from HCP Terraform if it exists."""
         try:
             endpoint = f"/organizations/{self.name}"
             response = self._request("GET", endpoint)
             return response
-        except Exception as e:
+        except HCPNotFoundError:
             # If the organization doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _create_organization(self):
         """Create a new organization in HCP Terraform."""
         endpoint = "/organizations"
         
-        # Prepare the attributes
+        # Prepare the attributes; the required ones are always sent
         attributes = {
             "name": self.name,
             "email": self.email,
-            "collaborator-auth-policy": self.params.get('collaborator_auth_policy')
+            "collaborator-auth-policy": self.params.get('collaborator_auth_policy'),
+            **self._build_attributes()
         }
         
-        # Add optional attributes if they are set
-        if self.params.get('description'):
-            attributes["description"] = self.params.get('description')
-            
-        if self.params.get('session_timeout') is not None:
-            attributes["session-timeout"] = self.params.get('session_timeout')
-            
-        if self.params.get('session_remember') is not None:
-            attributes["session-remember"] = self.params.get('session_remember')
-            
-        if self.params.get('cost_estimation_enabled') is not None:
-            attributes["cost-estimation-enabled"] = self.params.get('cost_estimation_enabled')
-            
-        if self.params.get('assessments_enforced') is not None:
-            attributes["assessments-enforced"] = self.params.get('assessments_enforced')
-            
-        if self.params.get('default_execution_mode'):
-            attributes["default-execution-mode"] = self.params.get('default_execution_mode')
-            
-        if self.params.get('allow_force_delete_workspaces') is not None:
-            attributes["allow-force-delete-workspaces"] = self.params.get('allow_force_delete_workspaces')
-        
         # Build the payload
         payload = {
             "data": {
@@ -269,40 +278,30 @@ class TerraformOrganizationModule(HCPTerraformModule):
         response = self._request("POST", endpoint, data=payload)
         return response
 
-    def _update_organization(self):
-        """Update an existing organization in HCP Terraform."""
+    def _compute_update_diff(self, existing):
+        """Return the requested attributes that differ from the existing organization."""
+        current = existing.get("data", {}).get("attributes", {})
+        return {
+            key: value for key, value in self._build_attributes().items()
+            if current.get(key) != value
+        }
+
+    def _update_organization(self, existing=None):
+        """
+        Update an existing organization in HCP Terraform.
+
+        When the current organization is passed in, only the attributes that
+        differ are sent, and None is returned without a request if nothing does.
+        """
         endpoint = f"/organizations/{self.name}"
         
-        # Prepare the attributes
-        attributes = {}
-        
-        # Add attributes that are being updated
-        if self.params.get('email'):
-            attributes["email"] = self.params.get('email')
-            
-        if self.params.get('description'):
-            attributes["description"] = self.params.get('description')
-            
-        if self.params.get('session_timeout') is not None:
-            attributes["session-timeout"] = self.params.get('session_timeout')
-            
-        if self.params.get('session_remember') is not None:
-            attributes["session-remember"] = self.params.get('session_remember')
-            
-        if self.params.get('collaborator_auth_policy'):
-            attributes["collaborator-auth-policy"] = self.params.get('collaborator_auth_policy')
-            
-        if self.params.get('cost_estimation_enabled') is not None:
-            attributes["cost-estimation-enabled"] = self.params.get('cost_estimation_enabled')
-            
-        if self.params.get('assessments_enforced') is not None:
-            attributes["assessments-enforced"] = self.params.get('assessments_enforced')
-            
-        if self.params.get('default_execution_mode'):
-            attributes["default-execution-mode"] = self.params.get('default_execution_mode')
-            
-        if self.params.get('allow_force_delete_workspaces') is not None:
-            attributes["allow-force-delete-workspaces"] = self.params.get('allow_force_delete_workspaces')
+        # Only send the attributes that are being updated
+        if existing is None:
+            attributes = self._build_attributes()
+        else:
+            attributes = self._compute_update_diff(existing)
+            if not attributes:
+                return None
         
         # Build the payload
         payload = {
@@ -347,6 +346,22 @@ class TerraformOrganizationModule(HCPTerraformModule):
     def run(self):
         """Main module execution logic."""
         try:
+            if self.state == 'present' and self.params.get('try_update_first') and not self.check_mode:
+                # Update blindly and create only on a 404, skipping the lookup
+                try:
+                    response = self._update_organization()
+                    msg = f"Organization '{self.name}' updated successfully"
+                except HCPNotFoundError:
+                    response = self._create_organization()
+                    msg = f"Organization '{self.name}' created successfully"
+                self.exit_json(
+                    changed=True,
+                    msg=msg,
+                    organization=self._format_organization_output(response),
+                    result=response
+                )
+                return
+
             # Get the current organization state
             organization = self._get_organization()
             
@@ -355,11 +370,16 @@ class TerraformOrganizationModule(HCPTerraformModule):
                 if self.state == 'present' and not organization:
                     self.exit_json(changed=True, msg=f"Would create organization '{self.name}'")
                 elif self.state == 'present' and organization:
-                    self.exit_json(changed=True, msg=f"Would update organization '{self.name}'")
+                    # Mirror the real run, which skips the PATCH when nothing differs
+                    if self._compute_update_diff(organization):
+                        self.exit_json(changed=True, msg=f"Would update organization '{self.name}'")
+                    else:
+                        self.exit_json(changed=False, msg=f"Organization '{self.name}' is already up to date")
                 elif self.state == 'absent' and organization:
                     self.exit_json(changed=True, msg=f"Would delete organization '{self.name}'")
                 else:
                     self.exit_json(changed=False, msg=f"No changes needed for organization '{self.name}'")
+                return
             
             # Apply the requested state
             if self.state == 'present':
@@ -373,8 +393,16 @@ class TerraformOrganizationModule(HCPTerraformModule):
                         result=response
                     )
                 else:
-                    # Update an existing organization
-                    response = self._update_organization()
+                    # Update an existing organization, if anything differs
+                    response = self._update_organization(existing=organization)
+                    if response is None:
+                        self.exit_json(
+                            changed=False,
+                            msg=f"Organization '{self.name}' is already up to date",
+                            organization=self._format_organization_output(organization),
+                            result=organization
+                        )
+                        return
                     self.exit_json(
                         changed=True,
                         msg=f"Organization '{self.name}' updated successfully",
@@ -174,7 +174,7 @@ result:
           type: dict
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformProjectModule(HCPTerraformModule):
     def __init__(self):
@@ -242,12 +242,9 @@ class TerraformProjectModule(HCPTerraformModule):
             endpoint = f"/projects/{self.project_id}"
             response = self._request("GET", endpoint)
             return response.get('data')
-        except Exception as e:
+        except HCPNotFoundError:
             # If the project doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _get_project(self):
         """Get a project by ID or name."""
@@ -252,7 +252,7 @@ result:
             type: list
 '''
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformVariableSetModule(HCPTerraformModule):
     def __init__(self):
@@ -308,11 +308,9 @@ class TerraformVariableSetModule(HCPTerraformModule):
                     return self._request("GET", f"/varsets/{varset_id}")
             
             return None
-        except Exception as e:
-            # If the variable set doesn't exist or there's an error, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            raise
+        except HCPNotFoundError:
+            # If the variable set doesn't exist, return None
+            return None
 
     def _prepare_payload(self):
         """Prepare the payload for creating or updating a variable set."""
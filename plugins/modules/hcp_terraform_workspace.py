@@ -270,7 +270,7 @@ result:
           type: dict
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 import time
 
 class TerraformWorkspaceModule(HCPTerraformModule):
@@ -327,12 +327,9 @@ class TerraformWorkspaceModule(HCPTerraformModule):
             endpoint = f"/organizations/{self.organization}/workspaces/{self.name}"
             response = self._request("GET", endpoint)
             return response
-        except Exception as e:
+        except HCPNotFoundError:
             # If the workspace doesn't exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _prepare_vcs_payload(self, vcs_repo):
         """Prepare the VCS repository payload."""
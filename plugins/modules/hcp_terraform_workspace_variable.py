@@ -199,7 +199,7 @@ result:
               sample: false
 """
 
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError, HCPTerraformModule
 
 class TerraformWorkspaceVariableModule(HCPTerraformModule):
     def __init__(self):
@@ -258,12 +258,9 @@ class TerraformWorkspaceVariableModule(HCPTerraformModule):
             
             # Variable not found
             return None
-        except Exception as e:
+        except HCPNotFoundError:
             # If no variables exist, return None
-            if "404" in str(e) or "not found" in str(e).lower():
-                return None
-            # Re-raise other exceptions
-            raise
+            return None
 
     def _create_variable(self):
         """Create a new variable in HCP Terraform."""
@@ -13,3 +13,23 @@ except ImportError as e:
 def configure_logging():
     """Ensure logs appear in pytest output"""
     logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s")
+
+@pytest.fixture(autouse=True)
+def reset_hcp_lookup_state(tmp_path, monkeypatch):
+    """Isolate tests from the process-wide state kept by the HCP lookup base classes"""
+    from ansible import constants as C
+    from ansible_collections.benemon.hcp_community_collection.plugins.module_utils import hcp_lookup, hcp_terraform_lookup
+
+    # Shared token files go to a per-test directory rather than the real local temp
+    monkeypatch.setattr(C, 'DEFAULT_LOCAL_TMP', str(tmp_path))
+    monkeypatch.delenv('HCP_SHARE_TOKEN', raising=False)
+    hcp_lookup._share_token_enabled.cache_clear()
+
+    for key in hcp_lookup._TOKEN_CACHE:
+        hcp_lookup._TOKEN_CACHE[key] = None
+    hcp_lookup._SHARED_SESSION.reset()
+    hcp_lookup._RESULT_CACHE.clear()
+    hcp_lookup._RATE_STATE.update(min_interval=0.0, last_attempt=0.0)
+    hcp_terraform_lookup._RESPONSE_CACHE.clear()
+    hcp_terraform_lookup._SHARED_SESSION.reset()
+    yield
@@ -172,7 +172,7 @@ def lookup():
 @pytest.fixture
 def mock_oauth_response():
     """Mock response for OAuth clients API calls"""
-    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_OAUTH_CLIENTS_RESPONSE
         mock.text = 'mock response'
@@ -189,8 +189,8 @@ def test_run_basic(lookup, mock_oauth_response):
         expected_call = call(
             'GET',
             'https://app.terraform.io/api/v2/organizations/my-organization/oauth-clients',
-            headers={'Authorization': 'Bearer test-token', 'Content-Type': 'application/vnd.api+json'},
-            params={}
+            headers={'Authorization': 'Bearer test-token'},
+            params={'page[size]': 100}
         )
         
         assert mock_oauth_response.call_args == expected_call
@@ -215,8 +215,8 @@ def test_run_with_explicit_params(lookup, mock_oauth_response):
     expected_call = call(
         'GET',
         'https://custom.terraform.io/api/v2/organizations/my-organization/oauth-clients',
-        headers={'Authorization': 'Bearer explicit-token', 'Content-Type': 'application/vnd.api+json'},
-        params={}
+        headers={'Authorization': 'Bearer explicit-token'},
+        params={'page[size]': 100}
     )
     
     assert mock_oauth_response.call_args == expected_call
@@ -246,7 +246,7 @@ def lookup():
 
 @pytest.fixture
 def mock_oauth_response():
-    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
         mock = MagicMock()
         # Ensure a fresh copy is returned on every call
         mock.json.return_value = MOCK_OAUTH_CLIENTS_RESPONSE.copy()
@@ -344,7 +344,7 @@ def test_run_pagination(lookup):
     """Test pagination handling"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
         # Mock paginated responses
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # First response has pagination info with next page
             first_response = MagicMock()
             first_response.json.return_value = MOCK_OAUTH_CLIENTS_PAGE1
@@ -386,7 +386,7 @@ def test_run_pagination(lookup):
 def test_http_error(lookup):
     """Test handling of HTTP errors"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Set up HTTP error
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = Exception("HTTP Error: 404 Not Found")
@@ -400,7 +400,7 @@ def test_http_error(lookup):
 def test_rate_limit_handling(lookup):
     """Test handling of rate limits"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request, \
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request, \
              patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.time.sleep') as mock_sleep:
             
             # First request hits rate limit
@@ -428,7 +428,7 @@ def test_rate_limit_handling(lookup):
 def test_empty_results(lookup):
     """Test handling of empty results"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Create an empty response
             empty_response = MagicMock()
             empty_response.status_code = 200
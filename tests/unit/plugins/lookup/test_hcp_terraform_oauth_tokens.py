@@ -111,7 +111,7 @@ def lookup():
 @pytest.fixture
 def mock_oauth_response():
     """Mock response for OAuth tokens API calls"""
-    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+    with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_OAUTH_TOKENS_RESPONSE
         mock.text = 'mock response'
@@ -128,8 +128,8 @@ def test_run_basic(lookup, mock_oauth_response):
         expected_call = call(
             'GET',
             'https://app.terraform.io/api/v2/oauth-clients/oc-GhHqb5rkeK19mLB8/oauth-tokens',
-            headers={'Authorization': 'Bearer test-token', 'Content-Type': 'application/vnd.api+json'},
-            params={}
+            headers={'Authorization': 'Bearer test-token'},
+            params={'page[size]': 100}
         )
         
         assert mock_oauth_response.call_args == expected_call
@@ -152,8 +152,8 @@ def test_run_with_explicit_params(lookup, mock_oauth_response):
     expected_call = call(
         'GET',
         'https://custom.terraform.io/api/v2/oauth-clients/oc-GhHqb5rkeK19mLB8/oauth-tokens',
-        headers={'Authorization': 'Bearer explicit-token', 'Content-Type': 'application/vnd.api+json'},
-        params={}
+        headers={'Authorization': 'Bearer explicit-token'},
+        params={'page[size]': 100}
     )
     
     assert mock_oauth_response.call_args == expected_call
@@ -179,7 +179,7 @@ def test_run_pagination(lookup):
     """Test pagination handling"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
         # Mock paginated responses
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # First response has pagination info with next page
             first_response = MagicMock()
             first_response.json.return_value = MOCK_OAUTH_TOKENS_PAGE1
@@ -230,7 +230,7 @@ def test_run_with_page_size(lookup, mock_oauth_response):
     expected_call = call(
         'GET',
         'https://app.terraform.io/api/v2/oauth-clients/oc-GhHqb5rkeK19mLB8/oauth-tokens',
-        headers={'Authorization': 'Bearer test-token', 'Content-Type': 'application/vnd.api+json'},
+        headers={'Authorization': 'Bearer test-token'},
         params={'page[size]': 50}
     )
     
@@ -240,7 +240,7 @@ def test_run_with_max_pages(lookup):
     """Test limiting the number of pages retrieved"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
         # Mock paginated responses
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Response with 3 total pages
             mock_response = MagicMock()
             response_data = MOCK_OAUTH_TOKENS_PAGE1.copy()
@@ -266,7 +266,7 @@ def test_run_disable_pagination(lookup):
     """Test disabling pagination"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
         # Mock paginated responses
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Response with multiple pages
             mock_response = MagicMock()
             response_data = MOCK_OAUTH_TOKENS_PAGE1.copy()
@@ -286,7 +286,7 @@ def test_run_disable_pagination(lookup):
 def test_http_error(lookup):
     """Test handling of HTTP errors"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Set up HTTP error
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = Exception("HTTP Error: 404 Not Found")
@@ -300,7 +300,7 @@ def test_http_error(lookup):
 def test_rate_limit_handling(lookup):
     """Test handling of rate limits"""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request, \
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request, \
              patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.time.sleep') as mock_sleep:
             
             # First request hits rate limit
@@ -328,7 +328,7 @@ def test_rate_limit_handling(lookup):
 def test_run_with_token_id(lookup):
     """Test retrieving a specific OAuth token using the Show endpoint."""
     with patch.dict('os.environ', {'TFE_TOKEN': 'test-token'}):
-        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.request') as mock_request:
+        with patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.requests.Session.request') as mock_request:
             # Set up the mock response (reusing our MOCK_OAUTH_TOKENS_RESPONSE)
             mock = MagicMock()
             mock.json.return_value = MOCK_OAUTH_TOKENS_RESPONSE
@@ -344,7 +344,7 @@ def test_run_with_token_id(lookup):
             expected_call = call(
                 'GET',
                 expected_url,
-                headers={'Authorization': 'Bearer test-token', 'Content-Type': 'application/vnd.api+json'},
+                headers={'Authorization': 'Bearer test-token'},
                 params=None
             )
             assert mock_request.call_args == expected_call
@@ -103,7 +103,7 @@ def test_organizations_lookup_success(lookup_instance, mock_make_request, mock_a
     assert len(result) == 1
     assert result[0] == ORGANIZATIONS_RESPONSE
     
-    mock_make_request.assert_called_once_with('GET', 'organizations', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'organizations', variables, {'page[size]': 100})
 
 # Test organization lookup with client-side name filter
 def test_organizations_lookup_with_name_filter(lookup_instance, mock_make_request, mock_auth_token, mock_hostname):
@@ -116,7 +116,7 @@ def test_organizations_lookup_with_name_filter(lookup_instance, mock_make_reques
     assert result[0]["data"][0]["attributes"]["name"] == "My Organization 1"
     assert len(result[0]["data"]) == 1
     
-    mock_make_request.assert_called_once_with('GET', 'organizations', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'organizations', variables, {'page[size]': 100})
 
 # Test server-side query parameter
 def test_organizations_lookup_with_query(lookup_instance, mock_auth_token, mock_hostname):
@@ -115,7 +115,7 @@ def test_projects_lookup_success(lookup_instance, mock_make_request, mock_auth_t
     assert len(result) == 1
     assert result[0] == PROJECTS_RESPONSE
     
-    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', variables, {'page[size]': 100})
 
 # Test project lookup with client-side name filter
 def test_projects_lookup_with_name_filter(lookup_instance, mock_make_request, mock_auth_token, mock_hostname):
@@ -128,7 +128,7 @@ def test_projects_lookup_with_name_filter(lookup_instance, mock_make_request, mo
     assert result[0]["data"][0]["attributes"]["name"] == "Project 1"
     assert len(result[0]["data"]) == 1
     
-    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', variables, {'page[size]': 100})
 
 # Test missing required parameters
 def test_projects_lookup_missing_params(lookup_instance, mock_auth_token, mock_hostname):
@@ -159,7 +159,7 @@ def test_projects_lookup_parse_terms(lookup_instance, mock_make_request, mock_au
         assert isinstance(result, list)
         assert len(result) == 1
         
-        mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', {"organization": "my-org"}, {})
+        mock_make_request.assert_called_once_with('GET', 'organizations/my-org/projects', {"organization": "my-org"}, {'page[size]': 100})
 
 # Test pagination handling
 def test_projects_lookup_pagination(lookup_instance, mock_auth_token, mock_hostname):
@@ -206,7 +206,7 @@ def test_varsets_lookup_by_organization(lookup_instance, mock_make_request, mock
     assert result[0] == VARSETS_RESPONSE
     
     # Verify the _make_request call
-    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/varsets', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/varsets', variables, {'page[size]': 100})
 
 # Test variable set lookup by project ID
 def test_varsets_lookup_by_project(lookup_instance, mock_make_request, mock_auth_token, mock_hostname):
@@ -220,7 +220,7 @@ def test_varsets_lookup_by_project(lookup_instance, mock_make_request, mock_auth
     assert result[0] == VARSETS_RESPONSE
     
     # Verify the _make_request call
-    mock_make_request.assert_called_once_with('GET', 'projects/prj-123456/varsets', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'projects/prj-123456/varsets', variables, {'page[size]': 100})
 
 # Test variable set lookup by workspace ID
 def test_varsets_lookup_by_workspace(lookup_instance, mock_make_request, mock_auth_token, mock_hostname):
@@ -234,7 +234,7 @@ def test_varsets_lookup_by_workspace(lookup_instance, mock_make_request, mock_au
     assert result[0] == VARSETS_RESPONSE
     
     # Verify the _make_request call
-    mock_make_request.assert_called_once_with('GET', 'workspaces/ws-123456/varsets', variables, {})
+    mock_make_request.assert_called_once_with('GET', 'workspaces/ws-123456/varsets', variables, {'page[size]': 100})
 
 # Test variable set lookup by ID
 def test_varsets_lookup_by_id(lookup_instance, mock_auth_token, mock_hostname):
@@ -252,7 +252,7 @@ def test_varsets_lookup_by_id(lookup_instance, mock_auth_token, mock_hostname):
         assert result[0] == VARSET_DETAIL_RESPONSE
         
         # Verify the _make_request call
-        mock.assert_called_once_with('GET', 'varsets/varset-123456', variables, {})
+        mock.assert_called_once_with('GET', 'varsets/varset-123456', variables, {'page[size]': 100})
 
 # Test variable set lookup with search query
 def test_varsets_lookup_with_search_query(lookup_instance, mock_make_request, mock_auth_token, mock_hostname):
@@ -265,7 +265,7 @@ def test_varsets_lookup_with_search_query(lookup_instance, mock_make_request, mo
     assert result[0] == VARSETS_RESPONSE
     
     # Verify the _make_request call includes the q parameter
-    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/varsets', variables, {'q': 'AWS'})
+    mock_make_request.assert_called_once_with('GET', 'organizations/my-org/varsets', variables, {'q': 'AWS', 'page[size]': 100})
 
 # Test missing required parameters
 def test_varsets_lookup_missing_params(lookup_instance, mock_auth_token, mock_hostname):
@@ -3,6 +3,7 @@ __metaclass__ = type
 
 import pytest
 import json
+from urllib.parse import urlencode
 from unittest.mock import MagicMock, patch, call
 from ansible.errors import AnsibleError
 from ansible_collections.benemon.hcp_community_collection.plugins.lookup.hvs_apps import LookupModule
@@ -48,7 +49,7 @@ def lookup():
 @pytest.fixture
 def mock_apps_response():
     """Mock response for apps API calls"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_APPS_RESPONSE
         mock.status_code = 200
@@ -57,7 +58,7 @@ def mock_apps_response():
 
 def test_auth_token_basic(lookup):
     """Test basic token acquisition"""
-    with patch('requests.post') as mock_auth_request:
+    with patch('requests.Session.post') as mock_auth_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = MOCK_TOKEN_RESPONSE
@@ -85,13 +86,13 @@ def test_auth_token_basic(lookup):
         
         mock_auth_request.assert_called_once_with(
             'https://auth.idp.hashicorp.com/oauth2/token',
-            data=expected_data,
+            data=urlencode(expected_data).encode('ascii'),
             headers={'Content-Type': 'application/x-www-form-urlencoded'}
         )
 
 def test_auth_token_rate_limit_with_retry_after(lookup):
     """Test rate limit handling with Retry-After header"""
-    with patch('requests.post') as mock_auth_request:
+    with patch('requests.Session.post') as mock_auth_request:
         # Create rate limit response
         rate_limit = MagicMock()
         rate_limit.status_code = 429
@@ -115,15 +116,16 @@ def test_auth_token_rate_limit_with_retry_after(lookup):
         with patch('time.sleep') as mock_sleep:
             token = lookup._get_auth_token(variables)
             
-            # Verify sleep was called with Retry-After value
-            mock_sleep.assert_called_once_with(2.0)
+            # Verify sleep honoured the Retry-After value as a floor
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] >= 2.0
         
         assert token == MOCK_TOKEN_RESPONSE['access_token']
         assert mock_auth_request.call_count == 2
 
 def test_auth_token_rate_limit_backoff(lookup):
     """Test rate limit handling with exponential backoff"""
-    with patch('requests.post') as mock_auth_request:
+    with patch('requests.Session.post') as mock_auth_request:
         # Create rate limit response
         rate_limit = MagicMock()
         rate_limit.status_code = 429
@@ -157,7 +159,7 @@ def test_auth_token_rate_limit_backoff(lookup):
 
 def test_auth_token_max_retries(lookup):
     """Test maximum retry limit"""
-    with patch('requests.post') as mock_auth_request:
+    with patch('requests.Session.post') as mock_auth_request:
         # Always return rate limit
         rate_limit = MagicMock()
         rate_limit.status_code = 429
@@ -179,7 +181,7 @@ def test_auth_token_max_retries(lookup):
 
 def test_auth_token_env_vars(lookup):
     """Test token acquisition using environment variables"""
-    with patch('requests.post') as mock_auth_request, \
+    with patch('requests.Session.post') as mock_auth_request, \
          patch.dict('os.environ', {'HCP_CLIENT_ID': 'env-client', 'HCP_CLIENT_SECRET': 'env-secret'}):
         
         mock_response = MagicMock()
@@ -203,14 +205,14 @@ def test_auth_token_env_vars(lookup):
         
         mock_auth_request.assert_called_once_with(
             'https://auth.idp.hashicorp.com/oauth2/token',
-            data=expected_data,
+            data=urlencode(expected_data).encode('ascii'),
             headers={'Content-Type': 'application/x-www-form-urlencoded'}
         )
         assert token == MOCK_TOKEN_RESPONSE['access_token']
 
 def test_auth_token_invalid_response(lookup):
     """Test handling of invalid token response"""
-    with patch('requests.post') as mock_auth_request:
+    with patch('requests.Session.post') as mock_auth_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'invalid': 'response'}  # Missing required fields
@@ -230,7 +232,7 @@ def test_auth_token_invalid_response(lookup):
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_APPS_RESPONSE
         mock.status_code = 200
@@ -315,7 +317,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Set up mock to first fail metadata call
         mock_request.side_effect = Exception('API Error')
         
@@ -51,7 +51,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.side_effect = [
             MOCK_METADATA_RESPONSE,
@@ -141,7 +141,7 @@ def test_run_missing_required_params(lookup):
 
 def test_run_wrong_secret_type(lookup):
     """Test error handling for wrong secret type"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = {
             'secret': {
@@ -173,7 +173,7 @@ def test_run_wrong_secret_type(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = Exception('API Error')
         
         variables = {
@@ -190,7 +190,7 @@ def test_api_error(lookup):
 
 def test_invalid_api_response(lookup):
     """Test handling of invalid API response"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = {}  # Empty response
         mock.status_code = 200
@@ -43,7 +43,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_SECRETS_RESPONSE
         mock.status_code = 200
@@ -132,7 +132,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error_handling(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Simulate API error
         mock_request.side_effect = Exception('API Error')
         
@@ -150,7 +150,7 @@ def test_api_error_handling(lookup):
 
 def test_pagination_with_next_token(lookup):
     """Test pagination with next page token"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Create responses for pagination
         first_response = MagicMock()
         first_response.status_code = 200
@@ -204,7 +204,7 @@ def test_secret_type_filtering(lookup, mock_response):
 
 def test_empty_response_handling(lookup):
     """Test handling of empty response"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'secrets': []}
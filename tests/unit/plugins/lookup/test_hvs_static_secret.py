@@ -46,7 +46,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         # Configure mock to return different responses for metadata and secret calls
         mock.json.side_effect = [
@@ -129,7 +129,7 @@ def test_run_missing_required_params(lookup):
 
 def test_run_wrong_secret_type(lookup):
     """Test error handling for wrong secret type"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = {
             'secret': {
@@ -154,7 +154,7 @@ def test_run_wrong_secret_type(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = Exception('API Error')
         
         variables = {
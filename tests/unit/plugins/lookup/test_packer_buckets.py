@@ -53,7 +53,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_BUCKETS_RESPONSE
         mock.status_code = 200
@@ -155,7 +155,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Set up mock to fail the request
         mock_request.side_effect = Exception('API Error')
         
@@ -174,7 +174,7 @@ def test_api_error(lookup):
 
 def test_empty_response_handling(lookup):
     """Test handling of empty response"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'buckets': []}
@@ -78,7 +78,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_CHANNEL_RESPONSE
         mock.status_code = 200
@@ -170,7 +170,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Set up mock to fail the API call
         mock_request.side_effect = Exception('API Error')
         
@@ -2,6 +2,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
+import copy
 import json
 from unittest.mock import MagicMock, patch, call
 from ansible.errors import AnsibleError
@@ -49,7 +50,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_CHANNELS_RESPONSE
         mock.status_code = 200
@@ -94,7 +95,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.side_effect = Exception('API Error')
         
         variables = {
@@ -110,7 +111,7 @@ def test_api_error(lookup):
 
 def test_empty_response_handling(lookup):
     """Test handling of empty response"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'channels': []}
@@ -157,6 +158,71 @@ def test_response_structure(lookup, mock_response):
     assert managed_channel['managed'] is True
     assert managed_channel['restricted'] is False
 
+def test_include_versions(lookup):
+    """Test that assigned versions are fetched and attached to each channel"""
+    def request_side_effect(method, url, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        if url.endswith('/channels'):
+            response.json.return_value = copy.deepcopy(MOCK_CHANNELS_RESPONSE)
+        else:
+            fingerprint = url.rsplit('/', 1)[-1]
+            response.json.return_value = {'version': {'fingerprint': fingerprint, 'builds': []}}
+        return response
+
+    with patch('requests.Session.request', side_effect=request_side_effect) as mock_request:
+        variables = {
+            'organization_id': 'test-org',
+            'project_id': 'test-proj',
+            'bucket_name': 'test-images',
+            'hcp_token': 'test-token'
+        }
+
+        result = lookup.run(['include_versions=true'], variables)
+
+        # One channels request plus one request per assigned version
+        assert mock_request.call_count == 3
+        version_urls = sorted(c.args[1] for c in mock_request.call_args_list[1:])
+        assert version_urls == [
+            'https://api.cloud.hashicorp.com/packer/2023-01-01/organizations/test-org/projects/test-proj/buckets/test-images/versions/abcd1234',
+            'https://api.cloud.hashicorp.com/packer/2023-01-01/organizations/test-org/projects/test-proj/buckets/test-images/versions/efgh5678'
+        ]
+
+        channels = result[0]
+        assert channels[0]['version_detail']['fingerprint'] == 'abcd1234'
+        assert channels[1]['version_detail']['fingerprint'] == 'efgh5678'
+
 def test_api_version(lookup):
     """Test that correct API version is used"""
-    assert lookup.api_version == '2023-01-01'
\ No newline at end of file
+    assert lookup.api_version == '2023-01-01'
+def test_include_versions_with_unassigned_channel(lookup):
+    """Test that a channel without an assigned version is left without version details"""
+    channels_response = copy.deepcopy(MOCK_CHANNELS_RESPONSE)
+    channels_response['channels'][1]['version'] = None
+
+    def request_side_effect(method, url, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        if url.endswith('/channels'):
+            response.json.return_value = copy.deepcopy(channels_response)
+        else:
+            fingerprint = url.rsplit('/', 1)[-1]
+            response.json.return_value = {'version': {'fingerprint': fingerprint, 'builds': []}}
+        return response
+
+    with patch('requests.Session.request', side_effect=request_side_effect) as mock_request:
+        variables = {
+            'organization_id': 'test-org',
+            'project_id': 'test-proj',
+            'bucket_name': 'test-images',
+            'hcp_token': 'test-token'
+        }
+
+        result = lookup.run(['include_versions=true'], variables)
+
+        # Only the assigned version is fetched
+        assert mock_request.call_count == 2
+        channels = result[0]
+        assert channels[0]['version_detail']['fingerprint'] == 'abcd1234'
+        assert 'version_detail' not in channels[1]
+        assert channels[1]['version'] is None
@@ -72,7 +72,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_VERSION_RESPONSE
         mock.status_code = 200
@@ -166,7 +166,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Set up mock to fail the API call
         mock_request.side_effect = Exception('API Error')
         
@@ -184,4 +184,91 @@ def test_api_error(lookup):
 
 def test_api_version(lookup):
     """Test that correct API version is used"""
-    assert lookup.api_version == '2023-01-01'
\ No newline at end of file
+    assert lookup.api_version == '2023-01-01'
+def test_parameter_logging_redacts_credentials(lookup, mock_response):
+    """Test that lookup parameters are only serialized at -vvv, with credentials masked"""
+    from ansible_collections.benemon.hcp_community_collection.plugins.lookup.packer_version import display
+
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'my-images',
+        'fingerprint': 'abcd1234',
+        'hcp_token': 'test-token'
+    }
+
+    # Below -vvv the parameters should not be serialized at all
+    with patch.object(display, 'verbosity', 0), patch.object(lookup, '_dumps') as mock_dumps:
+        lookup.run([], dict(variables))
+        mock_dumps.assert_not_called()
+
+    # At -vvv the parameters are logged without the token value
+    with patch.object(display, 'verbosity', 3), patch.object(display, 'vvv') as mock_vvv:
+        lookup.run([], dict(variables))
+        logged = ' '.join(str(c.args[0]) for c in mock_vvv.call_args_list)
+        assert 'Lookup parameters' in logged
+        assert 'test-token' not in logged
+
+def test_fields_projection(lookup, mock_response):
+    """Test that only the requested fields are returned"""
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'my-images',
+        'fingerprint': 'abcd1234',
+        'hcp_token': 'test-token'
+    }
+
+    result = lookup.run(['fields=fingerprint,builds.platform,builds.artifacts.region'], variables)
+
+    assert result[0] == {
+        'fingerprint': 'abcd1234',
+        'builds': [
+            {'platform': 'aws', 'artifacts': [{'region': 'us-west-1'}, {'region': 'us-east-1'}]},
+            {'platform': 'azure', 'artifacts': [{'region': 'westus'}]}
+        ]
+    }
+
+def test_endpoint_path_segments_are_quoted(lookup, mock_response):
+    """Test that bucket names and fingerprints cannot escape their path segment"""
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'team/images',
+        'fingerprint': 'abcd 1234',
+        'hcp_token': 'test-token'
+    }
+
+    lookup.run([], variables)
+
+    url = mock_response.call_args[0][1]
+    assert url.endswith('/buckets/team%2Fimages/versions/abcd%201234')
+
+def test_hcp_cache_revalidates_with_etag(lookup, tmp_path, monkeypatch):
+    """Test that a cached version is reused when the API answers 304 Not Modified"""
+    monkeypatch.setenv('HCP_CACHE_DIR', str(tmp_path))
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'my-images',
+        'fingerprint': 'abcd1234',
+        'hcp_token': 'test-token',
+        'hcp_cache': True
+    }
+
+    fresh = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+    fresh.json.return_value = MOCK_VERSION_RESPONSE
+    not_modified = MagicMock(status_code=304, headers={'ETag': '"v1"'})
+
+    with patch('requests.Session.request', side_effect=[fresh, not_modified]) as mock_request:
+        first = lookup.run([], dict(variables))
+        second = lookup.run([], dict(variables))
+
+    assert 'If-None-Match' not in mock_request.call_args_list[0][1]['headers']
+    assert mock_request.call_args_list[1][1]['headers']['If-None-Match'] == '"v1"'
+    assert second == first
+    not_modified.json.assert_not_called()
+
+    cache_files = list(tmp_path.iterdir())
+    assert len(cache_files) == 1
+    assert cache_files[0].stat().st_mode & 0o777 == 0o600
@@ -73,7 +73,7 @@ def lookup():
 
 @pytest.fixture
 def mock_response():
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock = MagicMock()
         mock.json.return_value = MOCK_VERSIONS_RESPONSE
         mock.status_code = 200
@@ -181,7 +181,7 @@ def test_run_missing_required_params(lookup):
 
 def test_api_error(lookup):
     """Test handling of API errors"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         # Set up mock to fail the request
         mock_request.side_effect = Exception('API Error')
         
@@ -204,7 +204,7 @@ def test_api_error(lookup):
 
 def test_empty_response_handling(lookup):
     """Test handling of empty response"""
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'versions': []}
@@ -256,4 +256,95 @@ def test_response_structure(lookup, mock_response):
 
 def test_api_version(lookup):
     """Test that correct API version is used"""
-    assert lookup.api_version == '2023-01-01'
\ No newline at end of file
+    assert lookup.api_version == '2023-01-01'
+def test_run_multiple_buckets(lookup):
+    """Test that versions from several buckets are returned in bucket order"""
+    def respond(method, url, **kwargs):
+        bucket = url.split('/buckets/')[1].split('/')[0]
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            'versions': [{'name': f'{bucket}-v1'}, {'name': f'{bucket}-v2'}],
+            'pagination': {}
+        }
+        return response
+
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'hcp_token': 'test-token'
+    }
+
+    with patch('requests.Session.request', side_effect=respond) as mock_request:
+        result = lookup.run(['bucket_name=web, db'], variables)
+
+    assert mock_request.call_count == 2
+    assert [version['name'] for version in result[0]] == ['web-v1', 'web-v2', 'db-v1', 'db-v2']
+
+def test_repeat_listing_sorted_from_cache(lookup, mock_response):
+    """Test that a repeat listing with a different order_by is served from the cache"""
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'test-images',
+        'hcp_token': 'test-token',
+        'hcp_cache_ttl': 30
+    }
+
+    first = lookup.run([], dict(variables))
+    resorted = lookup.run(['order_by=name desc'], dict(variables))
+
+    assert mock_response.call_count == 1
+    assert [v['name'] for v in resorted[0]] == sorted((v['name'] for v in first[0]), reverse=True)
+
+def test_cache_disabled_with_zero_ttl(lookup, mock_response):
+    """Test that hcp_cache_ttl=0 always queries the API"""
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'test-images',
+        'hcp_token': 'test-token',
+        'hcp_cache_ttl': 0
+    }
+
+    lookup.run([], dict(variables))
+    lookup.run([], dict(variables))
+
+    assert mock_response.call_count == 2
+
+def test_cache_disabled_by_default(lookup, mock_response):
+    """Test that repeat listings query the API unless hcp_cache_ttl is set"""
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'bucket_name': 'test-images',
+        'hcp_token': 'test-token'
+    }
+
+    lookup.run([], dict(variables))
+    lookup.run([], dict(variables))
+
+    assert mock_response.call_count == 2
+
+def test_run_multiple_buckets_sorted_across_buckets(lookup):
+    """Test that order_by sorts the combined versions of several buckets"""
+    def respond(method, url, **kwargs):
+        bucket = url.split('/buckets/')[1].split('/')[0]
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            'versions': [{'name': f'{bucket}-v2'}, {'name': f'{bucket}-v1'}],
+            'pagination': {}
+        }
+        return response
+
+    variables = {
+        'organization_id': 'test-org',
+        'project_id': 'test-proj',
+        'hcp_token': 'test-token',
+        'order_by': ['name desc'],
+        'fields': ['name']
+    }
+
+    with patch('requests.Session.request', side_effect=respond):
+        result = lookup.run(['bucket_name=db,web'], variables)
+
+    assert [version['name'] for version in result[0]] == ['web-v2', 'web-v1', 'db-v2', 'db-v1']
@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from ansible_collections.benemon.hcp_community_collection.plugins.modules.hcp_terraform_agent_pool import TerraformAgentPoolModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError
 from ansible.module_utils.basic import AnsibleModule
 
 # Mock responses for Agent Pool API
@@ -236,17 +237,58 @@ def test_agent_pool_already_gone(agent_pool_module):
     agent_pool_module.state = 'absent'
     agent_pool_module.id = 'apool-nonexistent'
     
-    # Mock the API request
-    with patch.object(agent_pool_module, '_get_agent_pool', return_value=None):
+    # Mock the API request: the DELETE itself reports the pool is missing
+    with patch.object(agent_pool_module, '_request', side_effect=HCPNotFoundError(404, "HTTP Error: 404 - Not Found")) as mock_request:
         # Run the module
         agent_pool_module.run()
         
+        # The pool is deleted by ID without looking it up first
+        mock_request.assert_called_once_with("DELETE", "/agent-pools/apool-nonexistent")
+        
         # Verify exit_json was called with the right parameters
         agent_pool_module.exit_json.assert_called_once()
         call_args = agent_pool_module.exit_json.call_args[1]
         assert call_args['changed'] is False
         assert call_args['msg'] == "Agent pool 'my-pool' already does not exist"
 
+# Test an ID that finds no pool falls back to creating one
+def test_present_by_id_creates_missing_pool(agent_pool_module):
+    agent_pool_module.id = 'apool-missing'
+    
+    def respond(method, endpoint, data=None):
+        if method == "GET":
+            raise HCPNotFoundError(404, "HTTP Error: 404 - Not Found")
+        return AGENT_POOL_CREATE_RESPONSE
+    
+    with patch.object(agent_pool_module, '_request', side_effect=respond) as mock_request:
+        agent_pool_module.run()
+        
+        assert [c[0][0] for c in mock_request.call_args_list] == ["GET", "POST"]
+        call_args = agent_pool_module.exit_json.call_args[1]
+        assert call_args['changed'] is True
+        assert call_args['msg'] == "Agent pool 'my-pool' created successfully"
+
+# Test an unchanged pool is reported as such without a PATCH
+def test_unchanged_agent_pool_skips_patch(agent_pool_module):
+    current = {
+        "data": {
+            "id": "apool-123",
+            "type": "agent-pools",
+            "attributes": {"name": "my-pool", "organization-scoped": False},
+            "relationships": {
+                "allowed-workspaces": {"data": [{"id": "ws-x9taqV23mxrGcDrn", "type": "workspaces"}]}
+            }
+        }
+    }
+    with patch.object(agent_pool_module, '_get_agent_pool', return_value=current):
+        with patch.object(agent_pool_module, '_update_agent_pool') as mock_update:
+            agent_pool_module.run()
+            
+            mock_update.assert_not_called()
+            call_args = agent_pool_module.exit_json.call_args[1]
+            assert call_args['changed'] is False
+            assert call_args['agent_pool']['id'] == "apool-123"
+
 # Test error handling
 def test_error_handling(agent_pool_module):
     # Define a custom function that would be called by run() to handle errors properly
@@ -291,4 +333,33 @@ def test_org_scoped_agent_pool(agent_pool_module):
             call_args = agent_pool_module.exit_json.call_args[1]
             assert call_args['changed'] is True
             assert 'agent_pool' in call_args
-            assert call_args['agent_pool']['organization_scoped'] is True
\ No newline at end of file
+            assert call_args['agent_pool']['organization_scoped'] is True
+# Test name lookups are filtered by the API and matched exactly
+def test_get_agent_pool_by_name_uses_server_filter(agent_pool_module):
+    similar = {"id": "apool-other", "type": "agent-pools", "attributes": {"name": "my-pool-2"}}
+    exact = {"id": "apool-exact", "type": "agent-pools", "attributes": {"name": "my-pool"}}
+    listing = {"data": [similar, exact]}
+    with patch.object(agent_pool_module, '_request', return_value=listing) as mock_request:
+        result = agent_pool_module._get_agent_pool_by_name()
+    
+    mock_request.assert_called_once_with(
+        "GET", "/organizations/my-organization/agent-pools", params={"q": "my-pool", "page[size]": 100}
+    )
+    assert result == {"data": exact}
+
+# Test create and update share one payload shape
+def test_build_payload_for_workspace_scoped_pool(agent_pool_module):
+    agent_pool_module.organization_scoped = False
+    agent_pool_module.allowed_workspaces = ['ws-1', 'ws-2']
+    
+    create = agent_pool_module._build_payload()
+    update = agent_pool_module._build_payload('apool-123')
+    
+    assert 'id' not in create['data']
+    assert update['data']['id'] == 'apool-123'
+    for payload in (create, update):
+        assert payload['data']['attributes'] == {"name": "my-pool", "organization-scoped": False}
+        assert payload['data']['relationships']['allowed-workspaces']['data'] == [
+            {"id": "ws-1", "type": "workspaces"},
+            {"id": "ws-2", "type": "workspaces"}
+        ]
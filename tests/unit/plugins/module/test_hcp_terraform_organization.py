@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from ansible_collections.benemon.hcp_community_collection.plugins.modules.hcp_terraform_organization import TerraformOrganizationModule
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPNotFoundError
 from ansible.module_utils.basic import AnsibleModule
 
 # Mock responses for Organization API
@@ -163,8 +164,9 @@ def test_check_mode_create(organization_module):
 
 # Test check mode for update
 def test_check_mode_update(organization_module):
-    # Set check mode to True
+    # Set check mode to True, with an attribute that differs from the API
     organization_module.check_mode = True
+    organization_module.params['description'] = "Updated organization description"
     
     # Mock the API request
     with patch.object(organization_module, '_get_organization', return_value=ORGANIZATION_DETAILS_RESPONSE):
@@ -229,4 +231,97 @@ def test_error_handling(organization_module):
             organization_module.run()
         
         # Verify the error message contains our API error
-        assert "Error managing organization" in str(excinfo.value)
\ No newline at end of file
+        assert "Error managing organization" in str(excinfo.value)
+# Test the request payloads built from module parameters
+def test_payload_attributes(organization_module):
+    organization_module.params['description'] = ''
+    organization_module.params['session_timeout'] = None
+    organization_module.params['session_remember'] = 20160
+
+    with patch.object(organization_module, '_request', return_value=ORGANIZATION_DETAILS_RESPONSE) as mock_request:
+        organization_module._update_organization()
+        organization_module._create_organization()
+
+    update_attrs = mock_request.call_args_list[0][1]['data']['data']['attributes']
+    create_attrs = mock_request.call_args_list[1][1]['data']['data']['attributes']
+    # Empty strings and unset values are left out; False booleans are sent
+    assert update_attrs == {
+        'email': 'admin@example.com',
+        'session-remember': 20160,
+        'collaborator-auth-policy': 'password',
+        'cost-estimation-enabled': False,
+        'assessments-enforced': False,
+        'default-execution-mode': 'remote',
+        'allow-force-delete-workspaces': False
+    }
+    assert create_attrs == dict(update_attrs, name='my-organization')
+
+# Test updating without a prior lookup
+def test_try_update_first_updates_without_lookup(organization_module):
+    organization_module.params['try_update_first'] = True
+
+    with patch.object(organization_module, '_get_organization') as mock_get:
+        with patch.object(organization_module, '_update_organization', return_value=ORGANIZATION_DETAILS_RESPONSE):
+            with patch.object(organization_module, '_create_organization') as mock_create:
+                organization_module.run()
+
+    mock_get.assert_not_called()
+    mock_create.assert_not_called()
+    call_args = organization_module.exit_json.call_args[1]
+    assert call_args['changed'] is True
+    assert call_args['msg'] == "Organization 'my-organization' updated successfully"
+
+# Test falling back to creation when the update finds nothing
+def test_try_update_first_creates_missing_organization(organization_module):
+    organization_module.params['try_update_first'] = True
+
+    with patch.object(organization_module, '_update_organization', side_effect=HCPNotFoundError(404, "HTTP Error: 404")):
+        with patch.object(organization_module, '_create_organization', return_value=ORGANIZATION_CREATE_RESPONSE):
+            organization_module.run()
+
+    organization_module.exit_json.assert_called_once()
+    call_args = organization_module.exit_json.call_args[1]
+    assert call_args['changed'] is True
+    assert call_args['msg'] == "Organization 'my-organization' created successfully"
+    assert call_args['organization']['name'] == 'new-organization'
+
+# Test that an unchanged organization is not patched
+def test_unchanged_organization_skips_patch(organization_module):
+    with patch.object(organization_module, '_request', return_value=ORGANIZATION_DETAILS_RESPONSE) as mock_request:
+        organization_module.run()
+
+    # Only the lookup is sent
+    mock_request.assert_called_once_with("GET", "/organizations/my-organization")
+    call_args = organization_module.exit_json.call_args[1]
+    assert call_args['changed'] is False
+    assert call_args['msg'] == "Organization 'my-organization' is already up to date"
+    assert call_args['organization']['name'] == 'my-organization'
+
+# Test that only differing attributes are patched
+def test_update_sends_only_changed_attributes(organization_module):
+    organization_module.params['description'] = "Updated organization description"
+    organization_module.params['cost_estimation_enabled'] = True
+
+    with patch.object(organization_module, '_request', return_value=ORGANIZATION_DETAILS_RESPONSE) as mock_request:
+        organization_module.run()
+
+    method, endpoint = mock_request.call_args[0]
+    assert (method, endpoint) == ("PATCH", "/organizations/my-organization")
+    assert mock_request.call_args[1]['data']['data']['attributes'] == {
+        'description': "Updated organization description",
+        'cost-estimation-enabled': True
+    }
+    assert organization_module.exit_json.call_args[1]['changed'] is True
+
+# Test check mode for an organization that is already up to date
+def test_check_mode_no_changes(organization_module):
+    organization_module.check_mode = True
+
+    with patch.object(organization_module, '_request', return_value=ORGANIZATION_DETAILS_RESPONSE) as mock_request:
+        organization_module.run()
+
+    mock_request.assert_called_once_with("GET", "/organizations/my-organization")
+    organization_module.exit_json.assert_called_once()
+    call_args = organization_module.exit_json.call_args[1]
+    assert call_args['changed'] is False
+    assert call_args['msg'] == "Organization 'my-organization' is already up to date"
@@ -1,5 +1,12 @@
+import os
 import pytest
-from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import str_to_bool
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils import collection_utils
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.collection_utils import build_url, decode_json, encode_json, format_json, full_jitter_backoff, parse_retry_after, str_to_bool
 
 def test_str_to_bool_true_values():
     # Test various representations that should be interpreted as True.
@@ -19,3 +26,76 @@ def test_str_to_bool_invalid_values():
     for value in invalid_values:
         with pytest.raises(ValueError, match="Invalid truth value"):
             str_to_bool(value)
+
+def test_build_url_normalizes_slashes():
+    # Endpoints with or without a leading slash produce the same URL.
+    expected = "https://app.terraform.io/api/v2/organizations"
+    assert build_url("https://app.terraform.io/api/v2", "organizations") == expected
+    assert build_url("https://app.terraform.io/api/v2", "/organizations") == expected
+    assert build_url("https://app.terraform.io/api/v2/", "/organizations") == expected
+
+def test_decode_json_handles_bytes_and_empty_bodies():
+    # Raw bodies are parsed directly; empty bodies return the given default.
+    response = MagicMock(content=b'{"data": [1, 2]}')
+    assert decode_json(response) == {"data": [1, 2]}
+    response.json.assert_not_called()
+    assert decode_json(MagicMock(content=b''), {}) == {}
+    assert decode_json(MagicMock(content=b'')) is None
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_encode_json_is_compact_utf8(has_orjson):
+    if has_orjson and not collection_utils.HAS_ORJSON:
+        pytest.skip('orjson is not installed')
+    with patch.object(collection_utils, 'HAS_ORJSON', has_orjson):
+        body = encode_json({'data': {'name': 'café', 'ids': [1, 2]}})
+    assert body == '{"data":{"name":"café","ids":[1,2]}}'.encode('utf-8')
+
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_format_json_indents_and_stringifies(has_orjson):
+    if has_orjson and not collection_utils.HAS_ORJSON:
+        pytest.skip('orjson is not installed')
+    with patch.object(collection_utils, 'HAS_ORJSON', has_orjson):
+        text = format_json({'cost': Decimal('1.50')})
+    assert text == '{\n  "cost": "1.50"\n}'
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    # Both Retry-After forms are honoured and clamped to the maximum delay.
+    assert parse_retry_after("5", 64) == 5.0
+    assert parse_retry_after("600", 64) == 64
+    assert parse_retry_after("-3", 64) == 0.0
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(future, 64) <= 30
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(past, 64) == 0.0
+
+def test_parse_retry_after_unusable_values():
+    # Missing or malformed headers leave the caller to use its own backoff.
+    for value in (None, "", "soon", "Mon, 99 Foo 2024"):
+        assert parse_retry_after(value, 64) is None
+
+def test_full_jitter_backoff_spans_whole_window():
+    # Delays are drawn from zero up to the capped exponential window.
+    with patch('random.uniform', side_effect=lambda low, high: high) as mock_uniform:
+        assert full_jitter_backoff(0, 2, 64) == 2
+        assert full_jitter_backoff(3, 2, 64) == 16
+        assert full_jitter_backoff(10, 2, 64) == 64
+    assert all(call[0][0] == 0 for call in mock_uniform.call_args_list)
+
+def test_shared_session_built_once_per_process():
+    # Settings are read when the session is built, again only after a fork.
+    settings = MagicMock(return_value=dict(pool_connections=2, pool_maxsize=4, timeout=(1, 2)))
+    shared = collection_utils.SharedSession(settings)
+    session = shared.get()
+    assert shared.get() is session
+    assert settings.call_count == 1
+    adapter = session.get_adapter('https://example.com')
+    assert adapter._pool_maxsize == 4
+    with patch('requests.adapters.HTTPAdapter.send', return_value='ok') as mock_send:
+        adapter.send('request', timeout=None)
+    assert mock_send.call_args[1]['timeout'] == (1, 2)
+
+    with patch('os.getpid', return_value=os.getpid() + 1):
+        assert shared.get() is not session
+    assert settings.call_count == 2
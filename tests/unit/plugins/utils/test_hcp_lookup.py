@@ -0,0 +1,285 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import pytest
+import requests
+import threading
+import time
+
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils import hcp_lookup
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_lookup import HCPLookup
+
+
+class _Lookup(HCPLookup):
+    def run(self, terms, variables=None, **kwargs):
+        return []
+
+
+def test_session_shared_across_calls():
+    # Every caller in the same process gets the same pooled session.
+    first = hcp_lookup._get_session()
+    second = hcp_lookup._get_session()
+    assert first is second
+
+def test_session_rebuilt_after_fork():
+    # A forked worker must not reuse the parent's connections.
+    parent = hcp_lookup._get_session()
+    with patch('os.getpid', return_value=os.getpid() + 1):
+        child = hcp_lookup._get_session()
+    assert child is not parent
+
+def test_session_pool_sized_for_concurrent_requests():
+    # Parallel fan-out should never block waiting for a pooled connection.
+    adapter = hcp_lookup._get_session().get_adapter('https://api.cloud.hashicorp.com')
+    assert adapter._pool_maxsize >= hcp_lookup._MAX_WORKERS
+
+def test_session_retries_idempotent_reads_only():
+    # Transient gateway errors on GETs are retried; the token POST is not.
+    retries = hcp_lookup._get_session().get_adapter('https://api.cloud.hashicorp.com').max_retries
+    assert retries.total == 3
+    assert 503 in retries.status_forcelist
+    assert retries.is_retry('GET', 503)
+    assert not retries.is_retry('POST', 503)
+
+def test_session_applies_default_timeout():
+    # Requests without an explicit timeout must not be able to hang forever.
+    adapter = hcp_lookup._get_session().get_adapter('https://api.cloud.hashicorp.com')
+    with patch.object(requests.adapters.HTTPAdapter, 'send', return_value='ok') as mock_send:
+        adapter.send('request', timeout=None)
+        adapter.send('request', timeout=5)
+    assert mock_send.call_args_list[0][1]['timeout'] == hcp_lookup._TIMEOUT
+    assert mock_send.call_args_list[1][1]['timeout'] == 5
+
+def test_token_cached_without_raw_secret():
+    # The token is reused for the same credentials and the secret itself is never cached.
+    credentials = {'hcp_client_id': 'id', 'hcp_client_secret': 's3cret'}
+    token_data = {'access_token': 'tok', 'expires_in': 3600}
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch:
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+        assert mock_fetch.call_count == 1
+
+        _Lookup()._get_auth_token(dict(credentials, hcp_client_secret='rotated'))
+        assert mock_fetch.call_count == 2
+
+    assert 'rotated' not in hcp_lookup._TOKEN_CACHE.values()
+
+def test_extract_results_known_keys():
+    lookup = _Lookup()
+    assert lookup._extract_results({'apps': [1], 'pagination': {}}) == {'results': [1]}
+    # 'secrets' takes precedence over 'secret' when both are present
+    assert lookup._extract_results({'secret': 's', 'secrets': ['s']}) == {'results': ['s']}
+    assert lookup._extract_results({'name': 'x', 'pagination': {}}) == {'results': [{'name': 'x'}]}
+    assert lookup._extract_results({'pagination': {}}) == {'results': []}
+
+def test_parse_terms_does_not_mutate_variables():
+    variables = {'organization_id': 'org', 'project_id': 'proj'}
+    merged = _Lookup()._parse_terms(['project_id=other', 'filter=a=b', 'ignored'], variables)
+    assert merged == {'organization_id': 'org', 'project_id': 'other', 'filter': 'a=b'}
+    assert variables == {'organization_id': 'org', 'project_id': 'proj'}
+
+def test_pagination_follows_token_past_short_pages():
+    # A server serving fewer items than page_size still returns every page.
+    pages = [
+        {'apps': [{'name': 'a'}, {'name': 'b'}], 'pagination': {'next_page_token': 't1'}},
+        {'apps': [{'name': 'c'}, {'name': 'd'}], 'pagination': {'next_page_token': 't2'}},
+        {'apps': [{'name': 'e'}], 'pagination': {}},
+    ]
+    lookup = _Lookup()
+    with patch.object(lookup, '_make_request', side_effect=pages) as mock_request:
+        result = lookup._handle_pagination('apps', {'page_size': 500})
+    assert [app['name'] for app in result['results']] == ['a', 'b', 'c', 'd', 'e']
+    assert mock_request.call_count == 3
+
+def test_credentials_resolved_once_per_variables():
+    lookup = _Lookup()
+    variables = {'hcp_token': 'tok'}
+    with patch.dict('os.environ', {}, clear=True):
+        first = lookup._resolve_credentials(variables)
+        with patch('os.environ.get') as mock_env:
+            assert lookup._resolve_credentials(variables) is first
+            mock_env.assert_not_called()
+    # A different mapping, as produced by each run(), is resolved afresh
+    assert lookup._resolve_credentials({'hcp_token': 'other'})[0] == 'other'
+
+def test_process_parameters_memoized_and_copied():
+    lookup = _Lookup()
+    variables = {'page_size': '5', 'types': ['kv']}
+    with patch.object(lookup, '_build_parameters', wraps=lookup._build_parameters) as mock_build:
+        params, config = lookup._process_parameters(variables)
+        params['pagination.next_page_token'] = 'abc'
+        again, _ = lookup._process_parameters(dict(variables))
+    assert mock_build.call_count == 1
+    assert again == {'pagination.page_size': 5, 'types': ['kv']}
+    assert config['page_size'] == 5
+
+def test_headers_reused_for_same_token():
+    lookup = _Lookup()
+    headers = lookup._get_headers('tok')
+    assert lookup._get_headers('tok') is headers
+    assert lookup._get_headers('new')['Authorization'] == 'Bearer new'
+
+def test_token_refreshed_after_two_thirds_of_lifetime(monkeypatch):
+    # Only the in-process clock is faked, so keep the epoch-based shared file out of it
+    monkeypatch.setenv('HCP_SHARE_TOKEN', 'false')
+    credentials = {'hcp_client_id': 'id', 'hcp_client_secret': 'secret'}
+    token_data = {'access_token': 'tok', 'expires_in': 3600}
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch, \
+            patch('time.monotonic', return_value=1000.0):
+        _Lookup()._get_auth_token(credentials)
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch, \
+            patch('time.monotonic', return_value=1000.0 + 2399):
+        _Lookup()._get_auth_token(credentials)
+        assert mock_fetch.call_count == 0
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch, \
+            patch('time.monotonic', return_value=1000.0 + 2400):
+        _Lookup()._get_auth_token(credentials)
+        assert mock_fetch.call_count == 1
+
+def test_concurrent_callers_share_one_token_request():
+    credentials = {'hcp_client_id': 'id', 'hcp_client_secret': 'secret'}
+
+    def slow_fetch(*args):
+        time.sleep(0.05)
+        return {'access_token': 'tok', 'expires_in': 3600}
+
+    with patch.object(HCPLookup, '_get_token_from_credentials', side_effect=slow_fetch) as mock_fetch:
+        threads = [threading.Thread(target=_Lookup()._get_auth_token, args=(credentials,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert mock_fetch.call_count == 1
+
+def test_backoff_delay_floors_at_retry_after():
+    lookup = _Lookup()
+    with patch('random.uniform', return_value=1.0):
+        assert lookup._backoff_delay(0, None, 2, 64) == 3.0
+        assert lookup._backoff_delay(10, None, 2, 64) == 65.0
+        assert lookup._backoff_delay(0, '30', 2, 64) == 30.0
+        assert lookup._backoff_delay(0, 'soon', 2, 64) == 3.0
+        # A huge Retry-After is clamped to max_delay
+        assert lookup._backoff_delay(0, '3600', 2, 64) == 64.0
+
+def test_token_retries_stop_at_deadline():
+    rate_limited = MagicMock(status_code=429, headers={'Retry-After': '3600'})
+    clock = [0.0]
+
+    def sleep(delay):
+        clock[0] += delay
+
+    with patch('requests.Session.post', return_value=rate_limited) as mock_post, \
+            patch('time.monotonic', side_effect=lambda: clock[0]), \
+            patch('time.sleep', side_effect=sleep) as mock_sleep, \
+            pytest.raises(AnsibleError, match='budget exhausted'):
+        _Lookup()._get_token_from_credentials('id', 'secret')
+    assert clock[0] == 180
+    assert max(c[0][0] for c in mock_sleep.call_args_list) <= 64
+    assert mock_post.call_count < 10
+
+def _response(content):
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+def test_decode_json_body():
+    lookup = _Lookup()
+    assert lookup._decode_json(_response(b'{"apps": [{"name": "a"}]}')) == {'apps': [{'name': 'a'}]}
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        lookup._decode_json(_response(b'not json'))
+    assert lookup._decode_json(_response(b'')) == {}
+
+def test_token_request_interval_adapts_to_rate_limits():
+    hcp_lookup._record_token_response(True)
+    hcp_lookup._record_token_response(True)
+    assert hcp_lookup._RATE_STATE['min_interval'] == 0.2
+    hcp_lookup._record_token_response(False)
+    assert hcp_lookup._RATE_STATE['min_interval'] == pytest.approx(0.18)
+
+    hcp_lookup._RATE_STATE['last_attempt'] = time.monotonic()
+    with patch('time.sleep') as mock_sleep:
+        hcp_lookup._pace_token_request()
+    assert 0 < mock_sleep.call_args[0][0] <= 0.18
+
+def test_shared_token_reused_by_other_workers(tmp_path, monkeypatch):
+    # Sharing is on by default; the fixture points the local temp dir at tmp_path.
+    credentials = {'hcp_client_id': 'id', 'hcp_client_secret': 'hunter2'}
+    token_data = {'access_token': 'tok', 'expires_in': 3600}
+
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch:
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+        # A freshly forked worker starts with an empty in-memory cache
+        for key in hcp_lookup._TOKEN_CACHE:
+            hcp_lookup._TOKEN_CACHE[key] = None
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+    assert mock_fetch.call_count == 1
+
+    token_files = list(tmp_path.iterdir())
+    assert len(token_files) == 1
+    assert token_files[0].stat().st_mode & 0o777 == 0o600
+    contents = token_files[0].read_text()
+    assert 'hunter2' not in contents
+    # The bearer token is only stored encrypted
+    assert 'tok' not in json.loads(contents).values()
+    assert 'token' not in json.loads(contents)
+
+def test_shared_token_unreadable_with_other_secret(tmp_path, monkeypatch):
+    # An entry encrypted under another secret is refreshed rather than trusted.
+    token_data = {'access_token': 'tok', 'expires_in': 3600}
+    lookup = _Lookup()
+
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data) as mock_fetch:
+        lookup._get_shared_token('id', 'other-secret', 'digest')
+        assert lookup._get_shared_token('id', 'hunter2', 'digest')['token'] == 'tok'
+    assert len(list(tmp_path.iterdir())) == 1
+    assert mock_fetch.call_count == 2
+
+def test_listing_cut_short_by_max_pages_is_not_reused():
+    # The first page by name cannot stand in for the first page by another order.
+    by_name = {'apps': [{'name': 'a'}, {'name': 'b'}], 'pagination': {'next_page_token': 't1'}}
+    by_created = {'apps': [{'name': 'a'}, {'name': 'c'}], 'pagination': {'next_page_token': 't1'}}
+    variables = {'hcp_token': 'x', 'max_pages': 1, 'hcp_cache_ttl': 30}
+    lookup = _Lookup()
+    with patch.object(lookup, '_make_request', side_effect=[by_name, by_created]) as mock_request:
+        lookup._handle_pagination('apps', variables, {'sorting.order_by': 'name'})
+        result = lookup._handle_pagination('apps', variables, {'sorting.order_by': 'created_at desc'})
+    assert [app['name'] for app in result['results']] == ['a', 'c']
+    assert mock_request.call_count == 2
+
+def test_cached_listing_sorted_by_list_order_by_and_copied():
+    # A list order_by, as packer lookups document it, sorts the cached listing;
+    # callers get their own copies of the cached items.
+    page = {'buckets': [{'name': 'b', 'rank': 1}, {'name': 'a', 'rank': 1}, {'name': 'c', 'rank': 0}], 'pagination': {}}
+    variables = {'hcp_token': 'x', 'hcp_cache_ttl': 30}
+    lookup = _Lookup()
+    with patch.object(lookup, '_make_request', return_value=page) as mock_request:
+        lookup._handle_pagination('buckets', variables)
+        result = lookup._handle_pagination('buckets', variables, {'sorting.order_by': ['rank desc', 'name']})
+        result['results'][0]['name'] = 'changed'
+        again = lookup._handle_pagination('buckets', variables)
+    assert mock_request.call_count == 1
+    assert [b['name'] for b in result['results']] == ['changed', 'b', 'c']
+    assert [b['name'] for b in again['results']] == ['b', 'a', 'c']
+
+@pytest.mark.parametrize('value', ['false', 'maybe'])
+def test_token_not_shared_when_disabled_or_invalid(tmp_path, monkeypatch, value):
+    # An invalid value warns once and falls back to per-worker tokens instead of
+    # failing every page of every listing.
+    monkeypatch.setenv('HCP_SHARE_TOKEN', value)
+    credentials = {'hcp_client_id': 'id', 'hcp_client_secret': 'hunter2'}
+    token_data = {'access_token': 'tok', 'expires_in': 3600}
+
+    with patch.object(HCPLookup, '_get_token_from_credentials', return_value=token_data), \
+            patch.object(hcp_lookup.display, 'warning') as mock_warning:
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+        for key in hcp_lookup._TOKEN_CACHE:
+            hcp_lookup._TOKEN_CACHE[key] = None
+        assert _Lookup()._get_auth_token(credentials) == 'tok'
+
+    assert list(tmp_path.iterdir()) == []
+    assert mock_warning.call_count == (1 if value == 'maybe' else 0)
@@ -0,0 +1,205 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import pytest
+import requests
+import threading
+
+from unittest.mock import MagicMock, patch
+from ansible.errors import AnsibleError
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils import hcp_terraform_lookup
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup import HCPTerraformLookup
+
+
+class _Lookup(HCPTerraformLookup):
+    def run(self, terms, variables=None, **kwargs):
+        return []
+
+
+def _page(number, total):
+    response = MagicMock(status_code=200, text='{}')
+    response.json.return_value = {
+        'data': [{'id': f'item-{number}'}],
+        'meta': {'pagination': {'current-page': number, 'total-pages': total}}
+    }
+    return response
+
+def test_pages_share_one_session():
+    # Every page of a listing goes over the same pooled session.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    sessions = []
+
+    def record(session, method, url, **kwargs):
+        sessions.append(session)
+        return _page(kwargs['params'].get('page[number]', 1), 3)
+
+    with patch('requests.Session.request', autospec=True, side_effect=record):
+        result = lookup._handle_pagination('organizations', {'token': 'test-token'})
+
+    assert [item['id'] for item in result['data']] == ['item-1', 'item-2', 'item-3']
+    assert len(sessions) == 3
+    assert all(session is hcp_terraform_lookup._get_session() for session in sessions)
+
+def test_auth_resolved_once_for_remaining_pages():
+    # Later pages reuse the headers built after the first page.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    with patch('requests.Session.request', side_effect=lambda *a, **k: _page(k['params'].get('page[number]', 1), 5)), \
+         patch.object(HCPTerraformLookup, '_get_auth_token', return_value='test-token') as mock_token:
+        result = lookup._handle_pagination('organizations', {'cache_ttl': 0})
+    assert len(result['data']) == 5
+    assert mock_token.call_count == 2
+
+def test_remaining_pages_fetched_concurrently_in_order():
+    # Later pages overlap in flight but are combined in page order.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    barrier = threading.Barrier(3, timeout=5)
+
+    def respond(method, url, **kwargs):
+        number = kwargs['params'].get('page[number]', 1)
+        if number > 1:
+            # Pages 2-4 only return once all three are in flight together
+            barrier.wait()
+        return _page(number, 4)
+
+    with patch('requests.Session.request', side_effect=respond):
+        result = lookup._handle_pagination('organizations', {'token': 'test-token'})
+    assert [item['id'] for item in result['data']] == ['item-1', 'item-2', 'item-3', 'item-4']
+
+def test_failed_page_keeps_earlier_pages():
+    # A failing page stops the listing but keeps the pages before it.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+
+    def respond(method, url, **kwargs):
+        number = kwargs['params'].get('page[number]', 1)
+        if number == 3:
+            raise ValueError('boom')
+        return _page(number, 4)
+
+    with patch('requests.Session.request', side_effect=respond):
+        result = lookup._handle_pagination('organizations', {'token': 'test-token'})
+    assert [item['id'] for item in result['data']] == ['item-1', 'item-2']
+
+def test_request_logging_skipped_below_vvv():
+    # Per-request debug lines are neither formatted nor emitted without -vvv.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    with patch('requests.Session.request', return_value=_page(1, 1)), \
+         patch('ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_lookup.display') as mock_display:
+        mock_display.verbosity = 0
+        lookup._make_request('GET', 'organizations', {'token': 'test-token'}, {'page[size]': 20})
+    mock_display.vvv.assert_not_called()
+
+def test_token_and_hostname_resolved_once_per_variables(monkeypatch):
+    # Repeated calls with the same variables skip the environment lookups.
+    monkeypatch.setenv('TFE_TOKEN', 'env-token')
+    monkeypatch.setenv('TFE_HOSTNAME', 'https://tfe.example.com')
+    lookup = _Lookup()
+    variables = {}
+    assert lookup._get_auth_token(variables) == 'env-token'
+    assert lookup._get_hostname(variables) == 'https://tfe.example.com/api/v2'
+
+    monkeypatch.setenv('TFE_TOKEN', 'rotated')
+    assert lookup._get_auth_token(variables) == 'env-token'
+    assert lookup._get_auth_token({}) == 'rotated'
+
+def test_combined_response_leaves_first_page_untouched():
+    # Combining pages must not mutate the first page's data or pagination meta.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    first = _page(1, 2)
+    first_body = first.json.return_value
+    with patch('requests.Session.request', side_effect=[first, _page(2, 2)]):
+        result = lookup._handle_pagination('organizations', {'token': 'test-token'})
+    assert len(result['data']) == 2
+    assert result['meta']['pagination']['current-page'] == 2
+    assert result['meta']['pagination']['next-page'] is None
+    assert len(first_body['data']) == 1
+    assert first_body['meta']['pagination']['current-page'] == 1
+
+def test_repeat_listing_served_from_cache():
+    # With cache_ttl set, a second identical listing is answered from memory.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    variables = {'token': 'test-token', 'cache_ttl': 30}
+    with patch('requests.Session.request', side_effect=lambda *a, **k: _page(k['params'].get('page[number]', 1), 2)) as mock_request:
+        first = lookup._handle_pagination('organizations', variables, {'q': 'prod'})
+        first['data'].clear()
+        second = lookup._handle_pagination('organizations', variables, {'q': 'prod'})
+        assert mock_request.call_count == 2
+        assert len(second['data']) == 2
+
+        lookup._handle_pagination('organizations', variables, {'q': 'dev'})
+        lookup._handle_pagination('organizations', dict(variables, cache_ttl=0), {'q': 'prod'})
+        assert mock_request.call_count == 6
+
+        # Caching is opt-in
+        lookup._handle_pagination('organizations', {'token': 'test-token'}, {'q': 'prod'})
+        assert mock_request.call_count == 8
+
+def test_incomplete_listing_not_cached():
+    # A listing cut short by a failed page is fetched again next time.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    responses = [_page(1, 2), ValueError('boom'), _page(1, 2), _page(2, 2)]
+    with patch('requests.Session.request', side_effect=responses) as mock_request:
+        variables = {'token': 'test-token', 'cache_ttl': 30}
+        assert len(lookup._handle_pagination('organizations', variables)['data']) == 1
+        assert len(lookup._handle_pagination('organizations', variables)['data']) == 2
+    assert mock_request.call_count == 4
+
+def test_session_shared_between_lookups():
+    # Separate lookup instances in one worker reuse the same connection pool.
+    parent = hcp_terraform_lookup._get_session()
+    assert hcp_terraform_lookup._get_session() is parent
+    # ...but a forked worker builds its own rather than sharing the parent's sockets
+    with patch('os.getpid', return_value=os.getpid() + 1):
+        assert hcp_terraform_lookup._get_session() is not parent
+
+def test_session_pool_size_override(monkeypatch):
+    # TFE_HCP_POOL_MAXSIZE sizes the pool, but never below the pagination workers.
+    monkeypatch.setenv('TFE_HCP_POOL_MAXSIZE', '64')
+    adapter = hcp_terraform_lookup._get_session().get_adapter('https://app.terraform.io')
+    assert adapter._pool_maxsize == 64
+
+    hcp_terraform_lookup._SHARED_SESSION.reset()
+    monkeypatch.setenv('TFE_HCP_POOL_MAXSIZE', '2')
+    adapter = hcp_terraform_lookup._get_session().get_adapter('https://app.terraform.io')
+    assert adapter._pool_maxsize == hcp_terraform_lookup._MAX_WORKERS
+
+def test_client_errors_are_not_retried():
+    # A 4xx other than 429 fails on the first attempt without backing off.
+    lookup = _Lookup()
+    lookup.base_url = 'https://app.terraform.io/api/v2'
+    response = requests.Response()
+    response.status_code = 401
+    response.url = 'https://app.terraform.io/api/v2/organizations'
+    with patch('requests.Session.request', return_value=response) as mock_request, \
+         patch('time.sleep') as mock_sleep:
+        with pytest.raises(AnsibleError, match='401'):
+            lookup._make_request('GET', 'organizations', {'token': 'test-token'})
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+def test_headers_reused_for_same_token():
+    # The header dict is built once per token rather than once per request.
+    lookup = _Lookup()
+    token = 'test-token'
+    headers = lookup._get_headers(token)
+    assert lookup._get_headers(token) is headers
+    assert headers['Authorization'] == 'Bearer test-token'
+    assert lookup._get_headers('other-token')['Authorization'] == 'Bearer other-token'
+
+def test_page_size_defaults_to_and_is_capped_at_api_maximum():
+    # Listings ask for the largest page the API allows unless told otherwise.
+    lookup = _Lookup()
+    with patch.object(HCPTerraformLookup, '_make_request', return_value={}) as mock_request:
+        lookup._handle_pagination('organizations', {'token': 'test-token'})
+        lookup._handle_pagination('projects', {'token': 'test-token', 'page_size': 500})
+        lookup._handle_pagination('workspaces', {'token': 'test-token', 'page_size': '10'})
+    sizes = [call[0][3]['page[size]'] for call in mock_request.call_args_list]
+    assert sizes == [100, 100, 10]
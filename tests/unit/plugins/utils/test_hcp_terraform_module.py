@@ -0,0 +1,101 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+import requests
+
+from unittest.mock import MagicMock, patch
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils import hcp_terraform_module
+from ansible_collections.benemon.hcp_community_collection.plugins.module_utils.hcp_terraform_module import HCPTerraformModule
+
+
+def _module():
+    # Bypass AnsibleModule argument parsing, as the module tests do.
+    module = HCPTerraformModule.__new__(HCPTerraformModule)
+    module.token = 'test-token'
+    module.base_url = 'https://app.terraform.io/api/v2'
+    return module
+
+def test_requests_share_one_session():
+    module = _module()
+    response = MagicMock(status_code=200, text='{}')
+    response.json.return_value = {}
+    with patch('requests.Session.request', return_value=response) as mock_request:
+        module._request('GET', '/organizations')
+        session = module._session
+        module._request('GET', '/organizations')
+    assert module._session is session
+    assert mock_request.call_count == 2
+    assert session.headers['Authorization'] == 'Bearer test-token'
+    assert 'Content-Type' not in session.headers
+    mock_request.assert_called_with('GET', 'https://app.terraform.io/api/v2/organizations', data=None, params=None, headers=None,
+                                    timeout=hcp_terraform_module._TIMEOUT)
+
+def test_content_type_sent_only_with_a_body():
+    # Writes send a compact UTF-8 JSON:API body; bodyless reads send no Content-Type.
+    module = _module()
+    response = MagicMock(status_code=200, text='{}')
+    response.json.return_value = {}
+    data = {'data': {'type': 'organizations', 'attributes': {'name': 'café'}}}
+    with patch('requests.Session.request', return_value=response) as mock_request:
+        module._request('POST', '/organizations', data=data)
+    mock_request.assert_called_once_with(
+        'POST', 'https://app.terraform.io/api/v2/organizations',
+        data='{"data":{"type":"organizations","attributes":{"name":"café"}}}'.encode('utf-8'), params=None,
+        headers={'Content-Type': 'application/vnd.api+json'}, timeout=hcp_terraform_module._TIMEOUT
+    )
+
+def test_error_responses_raise_typed_errors():
+    # A 404 is distinguishable by type; other client errors carry their status code.
+    module = _module()
+    for status_code, error_type in ((404, hcp_terraform_module.HCPNotFoundError), (403, hcp_terraform_module.HCPTerraformApiError)):
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = 'https://app.terraform.io/api/v2/organizations/missing'
+        with patch('requests.Session.request', return_value=response):
+            with pytest.raises(error_type) as excinfo:
+                module._request('GET', '/organizations/missing')
+        assert excinfo.value.status_code == status_code
+        assert f"HTTP Error: {status_code}" in str(excinfo.value)
+
+def test_payload_serialized_once_across_retries():
+    # A retried write resends the same encoded body instead of re-serializing it.
+    module = _module()
+    busy = MagicMock(status_code=429, headers={'Retry-After': '0'})
+    done = MagicMock(status_code=200, text='{}')
+    done.json.return_value = {}
+    with patch('requests.Session.request', side_effect=[busy, done]) as mock_request, \
+         patch('time.sleep'), \
+         patch.object(hcp_terraform_module, 'encode_json', wraps=hcp_terraform_module.encode_json) as mock_encode:
+        module._request('PATCH', '/organizations/org', data={'data': {}})
+    assert mock_encode.call_count == 1
+    first, second = (c[1]['data'] for c in mock_request.call_args_list)
+    assert first is second
+
+@pytest.mark.parametrize('status_code', [408, 500, 502, 503, 504])
+def test_transient_statuses_are_retried(status_code):
+    module = _module()
+    failed = MagicMock(status_code=status_code, text='busy')
+    failed.raise_for_status.side_effect = requests.exceptions.HTTPError(response=failed)
+    done = MagicMock(status_code=200, text='{}')
+    done.json.return_value = {'data': {}}
+    with patch('requests.Session.request', side_effect=[failed, done]) as mock_request, \
+         patch('time.sleep') as mock_sleep:
+        assert module._request('GET', '/organizations/org') == {'data': {}}
+    assert mock_request.call_count == 2
+    mock_sleep.assert_called_once()
+
+@pytest.mark.parametrize('method', ['POST', 'PATCH'])
+@pytest.mark.parametrize('status_code', [502, 504])
+def test_gateway_errors_not_retried_for_unsafe_methods(method, status_code):
+    # The write may already have been applied, so repeating it could duplicate it.
+    module = _module()
+    failed = MagicMock(status_code=status_code, text='bad gateway')
+    failed.raise_for_status.side_effect = requests.exceptions.HTTPError(response=failed)
+    with patch('requests.Session.request', return_value=failed) as mock_request, \
+         patch('time.sleep') as mock_sleep:
+        with pytest.raises(hcp_terraform_module.HCPTerraformApiError) as excinfo:
+            module._request(method, '/organizations', data={'data': {}})
+    assert excinfo.value.status_code == status_code
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()